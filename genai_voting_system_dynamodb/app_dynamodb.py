@@ -1,19 +1,55 @@
-import json
 import boto3
+import orjson
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError
 import os
 import logging
 import base64
+import gzip
+import hashlib
+import random
+import time
 from decimal import Decimal
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import uuid
 
 # Configure logging
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
-# AWS clients
-dynamodb = boto3.resource('dynamodb')
-ses_client = boto3.client('ses')
+# AWS clients share one session and a connection pool sized for the thread-pool fan-out.
+# Each call gets two attempts in total (the first try plus one retry), so a stalled call
+# gives up after roughly 15 s at worst (2 x (2 s connect + 5 s read) plus backoff) and
+# surfaces as an error instead of hanging on the default 60 s read timeout
+boto_config = Config(
+    max_pool_connections=50,
+    retries={'mode': 'standard', 'total_max_attempts': 2},
+    connect_timeout=2,
+    read_timeout=5,
+    tcp_keepalive=True
+)
+boto_session = boto3.session.Session()
+dynamodb = boto_session.resource('dynamodb', config=boto_config)
+dynamodb_client = boto_session.client('dynamodb', config=boto_config)
+ses_client = boto_session.client('ses', config=boto_config)
+lambda_client = boto_session.client('lambda', config=boto_config)
+
+# Response headers, built once and shared by every response
+SECURITY_HEADERS = {
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token',
+    'Access-Control-Allow-Methods': 'GET,POST,PUT,DELETE,OPTIONS',
+    'Access-Control-Max-Age': '86400',
+    'X-Content-Type-Options': 'nosniff'
+}
+JSON_HEADERS = {'Content-Type': 'application/json', **SECURITY_HEADERS}
+HTML_HEADERS = {'Content-Type': 'text/html', **SECURITY_HEADERS}
+
+# Bodies smaller than this aren't worth gzipping
+GZIP_MIN_BYTES = 1024
 
 # Table references
 TEAMS_TABLE = os.environ.get('TEAMS_TABLE')
@@ -22,29 +58,98 @@ VOTES_TABLE = os.environ.get('VOTES_TABLE')
 CRITERIA_TABLE = os.environ.get('CRITERIA_TABLE')
 SETTINGS_TABLE = os.environ.get('SETTINGS_TABLE')
 
+# Votes GSI keyed by criteria_id; empty during a staged upgrade that has not created it yet
+VOTES_CRITERIA_INDEX = os.environ.get('VOTES_CRITERIA_INDEX', 'criteria-index')
+
 teams_table = dynamodb.Table(TEAMS_TABLE)
 judges_table = dynamodb.Table(JUDGES_TABLE)
 votes_table = dynamodb.Table(VOTES_TABLE)
 criteria_table = dynamodb.Table(CRITERIA_TABLE)
 settings_table = dynamodb.Table(SETTINGS_TABLE)
 
-def get_base64_image(filename):
-    """Convert image file to base64 string"""
+# Shared pool for fanning out independent DynamoDB reads; reused across warm invocations
+executor = ThreadPoolExecutor(max_workers=8)
+
+def warm_up_dynamodb():
+    """Open the DynamoDB connections during cold start so the first request skips the TLS handshake"""
+    # The resource (writes) and the low-level client (scans) keep separate connection pools
+    warm_ups = (
+        lambda: settings_table.get_item(Key={'key': 'criteria_seq'}),
+        lambda: dynamodb_client.get_item(TableName=SETTINGS_TABLE, Key={'key': {'S': 'criteria_seq'}})
+    )
     try:
-        with open(filename, 'rb') as image_file:
-            return base64.b64encode(image_file.read()).decode('utf-8')
+        for future in [executor.submit(warm_up) for warm_up in warm_ups]:
+            future.result()
     except Exception as e:
-        logger.error(f"Error loading image {filename}: {str(e)}")
-        return ""
+        logger.warning(f"DynamoDB warm-up failed: {str(e)}")
+
+if SETTINGS_TABLE:
+    warm_up_dynamodb()
+
+# Votes is the largest table, so full scans of it are split into parallel segments
+VOTES_SCAN_SEGMENTS = 4
+
+# BatchGetItem rounds before throttled, still-unprocessed keys fail the request
+BATCH_GET_MAX_ROUNDS = 5
 
-def send_vote_confirmation_email(judge_email, judge_name, team_name, votes_data):
-    """Send vote confirmation email to judge using Amazon SES"""
+# Every key the settings table is ever written with
+SETTINGS_KEYS = ('criteria_seq', 'sample_data_cleared', 'data_cleared_at', 'user_managed')
+
+# Criteria rarely change, so warm containers reuse the last scan for a short while
+CRITERIA_CACHE_TTL = 60
+_criteria_cache = {'loaded_at': 0, 'items': None}
+
+# /debug-db bodies keyed by (counts_only, pretty), reused for a couple of seconds
+DEBUG_CACHE_TTL = 2
+_debug_cache = {}
+
+# Set once the criteria table has been seeded; persists across warm invocations
+_DB_INITIALIZED = False
+
+# Criteria seeded into an empty criteria table
+DEFAULT_CRITERIA = (
+    {"id": "1", "name": "Problem Understanding", "weight": Decimal('15'), "max_score": 1},
+    {"id": "2", "name": "Success Criteria Definition", "weight": Decimal('15'), "max_score": 1},
+    {"id": "3", "name": "Demo Relevance", "weight": Decimal('15'), "max_score": 1},
+    {"id": "4", "name": "Service Correlation", "weight": Decimal('15'), "max_score": 1},
+    {"id": "5", "name": "GenAI Services Usage", "weight": Decimal('15'), "max_score": 1},
+    {"id": "6", "name": "Team Collaboration", "weight": Decimal('10'), "max_score": 1},
+    {"id": "7", "name": "Notes of Unanswered Questions", "weight": Decimal('15'), "max_score": 1}
+)
+
+@lru_cache(maxsize=16)
+def get_base64_file(filename):
+    """Read a bundled file as a base64 string (cached; bundled files don't change within a container)"""
     try:
-        # Create email content
-        subject = f"Vote Confirmation - FSI 3 Hackaton GenAI Training"
-        
-        # Create HTML email body
-        html_body = f"""
+        with open(filename, 'rb') as bundled_file:
+            return base64.b64encode(bundled_file.read()).decode('utf-8')
+    except Exception as e:
+        logger.error(f"Error loading file {filename}: {str(e)}")
+        return ""
+
+# Main page template bundled next to this module, read once at cold start
+MAIN_PAGE_TEMPLATE = 'main_page.html'
+
+# Bundled files served from /static/ with a far-future cache lifetime; the page links
+# them with a content hash so a redeploy with new content busts browser caches
+STATIC_FILES = {
+    'Class2025IgniteSticker.png': 'image/png',
+    'IgniteSticker.png': 'image/png',
+    'partials/admin.html': 'text/html',
+    'js/app.js': 'text/javascript',
+    'js/admin.js': 'text/javascript',
+    'js/leaderboard.js': 'text/javascript'
+}
+STATIC_PREFIX = '/static/'
+
+# SES error codes that can succeed on a later attempt; anything else (rejected message, unverified
+# sender) would fail the same way again
+SES_RETRYABLE_ERRORS = frozenset({'Throttling', 'ThrottlingException', 'ServiceUnavailable', 'InternalFailure', 'RequestTimeout'})
+
+# Confirmation email templates, formatted per submission
+EMAIL_SUBJECT = "Vote Confirmation - FSI 3 Hackaton GenAI Training"
+
+EMAIL_HTML_HEADER = """
         <html>
         <head>
             <style>
@@ -71,28 +176,22 @@ def send_vote_confirmation_email(judge_email, judge_name, team_name, votes_data)
                 
                 <div class="vote-summary">
                     <h3>🎯 Team: {team_name}</h3>
-                    <p><strong>Submission Time:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}</p>
-                    <p><strong>Total Criteria Evaluated:</strong> {len(votes_data)}</p>
+                    <p><strong>Submission Time:</strong> {submitted_at}</p>
+                    <p><strong>Total Criteria Evaluated:</strong> {vote_count}</p>
                 </div>
                 
                 <h3>📊 Your Votes:</h3>
         """
-        
-        # Add each vote to the email
-        for vote in votes_data:
-            vote_display = "✅ YES" if vote['score'] == 1 else "❌ NO"
-            vote_class = "vote-yes" if vote['score'] == 1 else "vote-no"
-            comments = vote.get('comments', 'No comments')
-            
-            html_body += f"""
+
+EMAIL_HTML_VOTE = """
                 <div class="criteria-item">
-                    <strong>{vote['criteria_name']}</strong><br>
+                    <strong>{criteria_name}</strong><br>
                     <span class="{vote_class}">Vote: {vote_display}</span><br>
                     <em>Comments: {comments}</em>
                 </div>
             """
-        
-        html_body += f"""
+
+EMAIL_HTML_FOOTER = """
                 <p>Your votes have been successfully recorded in the competition system.</p>
                 
                 <p>Best regards,<br>
@@ -106,9 +205,8 @@ def send_vote_confirmation_email(judge_email, judge_name, team_name, votes_data)
         </body>
         </html>
         """
-        
-        # Create plain text version
-        text_body = f"""
+
+EMAIL_TEXT_HEADER = """
 Vote Confirmation - FSI 3 Hackaton GenAI Training
 
 Dear {judge_name},
@@ -116,21 +214,18 @@ Dear {judge_name},
 Thank you for submitting your votes! This email confirms your evaluation for:
 
 Team: {team_name}
-Submission Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}
-Total Criteria Evaluated: {len(votes_data)}
+Submission Time: {submitted_at}
+Total Criteria Evaluated: {vote_count}
 
 Your Votes:
 """
-        
-        for vote in votes_data:
-            vote_display = "YES" if vote['score'] == 1 else "NO"
-            comments = vote.get('comments', 'No comments')
-            text_body += f"""
-- {vote['criteria_name']}: {vote_display}
+
+EMAIL_TEXT_VOTE = """
+- {criteria_name}: {vote_display}
   Comments: {comments}
 """
-        
-        text_body += f"""
+
+EMAIL_TEXT_FOOTER = """
 Your votes have been successfully recorded in the competition system.
 
 Best regards,
@@ -140,6 +235,48 @@ FSI 3 Hackaton GenAI Training Team
 This is an automated confirmation email from the FSI 3 Hackaton GenAI Training voting system.
 Powered by AWS - Amazon SES
         """
+
+def is_retryable_email_error(error):
+    """Whether an SES send failure is transient: throttling, a service-side error or a network failure"""
+    if isinstance(error, ClientError):
+        return error.response.get('Error', {}).get('Code') in SES_RETRYABLE_ERRORS
+    return isinstance(error, BotoCoreError)
+
+def send_vote_confirmation_email(judge_email, judge_name, team_name, votes_data, raise_retryable=False):
+    """Send vote confirmation email to judge using Amazon SES; with raise_retryable, transient failures raise instead of returning False"""
+    try:
+        # Create email content
+        subject = EMAIL_SUBJECT
+        summary = {
+            'judge_name': judge_name,
+            'team_name': team_name,
+            'submitted_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC'),
+            'vote_count': len(votes_data)
+        }
+        
+        # Create HTML and plain text bodies, one fragment per vote
+        html_parts = [EMAIL_HTML_HEADER.format(**summary)]
+        text_parts = [EMAIL_TEXT_HEADER.format(**summary)]
+        for vote in votes_data:
+            is_yes = vote['score'] == 1
+            comments = vote.get('comments', 'No comments')
+            
+            html_parts.append(EMAIL_HTML_VOTE.format(
+                criteria_name=vote['criteria_name'],
+                vote_class="vote-yes" if is_yes else "vote-no",
+                vote_display="✅ YES" if is_yes else "❌ NO",
+                comments=comments
+            ))
+            text_parts.append(EMAIL_TEXT_VOTE.format(
+                criteria_name=vote['criteria_name'],
+                vote_display="YES" if is_yes else "NO",
+                comments=comments
+            ))
+        html_parts.append(EMAIL_HTML_FOOTER)
+        text_parts.append(EMAIL_TEXT_FOOTER)
+        
+        html_body = "".join(html_parts)
+        text_body = "".join(text_parts)
         
         # Send email using SES
         response = ses_client.send_email(
@@ -171,55 +308,876 @@ Powered by AWS - Amazon SES
         
     except Exception as e:
         logger.error(f"Failed to send email to {judge_email}: {str(e)}")
+        if raise_retryable and is_retryable_email_error(e):
+            raise
         return False
 
-def get_security_headers():
-    return {
-        'Access-Control-Allow-Origin': '*',
-        'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token',
-        'Access-Control-Allow-Methods': 'GET,POST,PUT,DELETE,OPTIONS',
-        'Access-Control-Max-Age': '86400'
+def queue_vote_confirmation_email(function_arn, judge_email, judge_name, team_name, votes_data):
+    """Queue the confirmation email by asynchronously invoking this function with an email job"""
+    email_job = {
+        'judge_email': judge_email,
+        'judge_name': judge_name,
+        'team_name': team_name,
+        'votes_data': votes_data
     }
+    
+    try:
+        lambda_client.invoke(
+            FunctionName=function_arn,
+            InvocationType='Event',
+            Payload=orjson.dumps({'email_job': email_job})
+        )
+        logger.info(f"Queued confirmation email to {judge_email}")
+        return 'queued'
+    except Exception as e:
+        # Fall back to sending inline so the judge still gets a confirmation
+        logger.error(f"Failed to queue email to {judge_email}, sending inline: {str(e)}")
+        return 'sent' if send_vote_confirmation_email(**email_job) else 'failed'
+
+class FloatDeserializer(TypeDeserializer):
+    """Deserialize DynamoDB numbers straight to float, skipping the Decimal round trip"""
+    def _deserialize_n(self, value):
+        return float(value)
+
+float_deserializer = FloatDeserializer()
+type_serializer = TypeSerializer()
+
+def deserialize_item(item):
+    """Turn a low-level DynamoDB item into a plain dict with float numbers"""
+    return {key: float_deserializer.deserialize(value) for key, value in item.items()}
+
+def iter_scan(table, **kwargs):
+    """Yield the items of every scan page, following LastEvaluatedKey past the 1 MB page limit"""
+    # Scans go through the low-level client so numbers never materialize as Decimals
+    response = dynamodb_client.scan(TableName=table.name, **kwargs)
+    yield from map(deserialize_item, response['Items'])
+    while 'LastEvaluatedKey' in response:
+        response = dynamodb_client.scan(TableName=table.name, ExclusiveStartKey=response['LastEvaluatedKey'], **kwargs)
+        yield from map(deserialize_item, response['Items'])
+
+def scan_all(table, **kwargs):
+    """Scan every page of a table into a single list"""
+    return list(iter_scan(table, **kwargs))
+
+def parallel_scan(table, total_segments, **kwargs):
+    """Scan a table as concurrent segments on the shared pool and concatenate the items"""
+    futures = [
+        executor.submit(scan_all, table, Segment=segment, TotalSegments=total_segments, **kwargs)
+        for segment in range(total_segments)
+    ]
+    return [item for future in futures for item in future.result()]
+
+def iter_query(table, **kwargs):
+    """Yield the items of every query page of a table or index, following LastEvaluatedKey"""
+    # Like scans, queries go through the low-level client; callers pass plain key values,
+    # which are typed here the way the table resource would
+    if 'ExpressionAttributeValues' in kwargs:
+        kwargs['ExpressionAttributeValues'] = {
+            name: type_serializer.serialize(value) for name, value in kwargs['ExpressionAttributeValues'].items()
+        }
+    response = dynamodb_client.query(TableName=table.name, **kwargs)
+    yield from map(deserialize_item, response['Items'])
+    while 'LastEvaluatedKey' in response:
+        response = dynamodb_client.query(TableName=table.name, ExclusiveStartKey=response['LastEvaluatedKey'], **kwargs)
+        yield from map(deserialize_item, response['Items'])
+
+def query_all(table, **kwargs):
+    """Query every page of a table or index into a single list"""
+    return list(iter_query(table, **kwargs))
+
+def count_all(table, **kwargs):
+    """Count the items matching a query across every page without transferring them"""
+    response = table.query(Select='COUNT', **kwargs)
+    count = response['Count']
+    while 'LastEvaluatedKey' in response:
+        response = table.query(Select='COUNT', ExclusiveStartKey=response['LastEvaluatedKey'], **kwargs)
+        count += response['Count']
+    return count
+
+def count_scan(table):
+    """Count every item in a table across all scan pages without transferring them"""
+    response = dynamodb_client.scan(TableName=table.name, Select='COUNT')
+    count = response['Count']
+    while 'LastEvaluatedKey' in response:
+        response = dynamodb_client.scan(TableName=table.name, Select='COUNT', ExclusiveStartKey=response['LastEvaluatedKey'])
+        count += response['Count']
+    return count
+
+def batch_get_by_id(table_name, ids, attributes, key='id'):
+    """Fetch items by key with BatchGetItem (100 keys per request), returning a key -> item dict"""
+    ids = list(ids)
+    names = {f'#a{i}': attribute for i, attribute in enumerate([key] + attributes)}
+    items = {}
+    for start in range(0, len(ids), 100):
+        request = {
+            table_name: {
+                'Keys': [{key: type_serializer.serialize(item_id)} for item_id in ids[start:start + 100]],
+                'ProjectionExpression': ', '.join(names),
+                'ExpressionAttributeNames': names
+            }
+        }
+        for attempt in range(BATCH_GET_MAX_ROUNDS):
+            response = dynamodb_client.batch_get_item(RequestItems=request)
+            for item in map(deserialize_item, response['Responses'].get(table_name, [])):
+                items[item[key]] = item
+            request = response.get('UnprocessedKeys')
+            if not request:
+                break
+            if attempt == BATCH_GET_MAX_ROUNDS - 1:
+                raise RuntimeError(f"BatchGetItem on {table_name} left keys unprocessed after {BATCH_GET_MAX_ROUNDS} rounds")
+            # Unprocessed keys mean the table is throttling; back off with jitter before asking again
+            time.sleep(min(0.05 * 2 ** attempt, 1) * random.random())
+    return items
+
+def get_cached_criteria():
+    """Return all criteria, rescanning the table only when the cached copy is older than the TTL"""
+    if _criteria_cache['items'] is None or time.time() - _criteria_cache['loaded_at'] >= CRITERIA_CACHE_TTL:
+        _criteria_cache['items'] = scan_all(criteria_table)
+        _criteria_cache['loaded_at'] = time.time()
+    return _criteria_cache['items']
+
+def invalidate_criteria_cache():
+    _criteria_cache['loaded_at'] = 0
+    _criteria_cache['items'] = None
+
+def next_criteria_id():
+    """Allocate the next numeric criteria ID from an atomic counter in the settings table"""
+    response = settings_table.update_item(
+        Key={'key': 'criteria_seq'},
+        UpdateExpression='ADD #value :one',
+        ExpressionAttributeNames={'#value': 'value'},
+        ExpressionAttributeValues={':one': Decimal(1)},
+        ReturnValues='UPDATED_NEW'
+    )
+    return str(int(response['Attributes']['value']))
 
 def decimal_default(obj):
     if isinstance(obj, Decimal):
         return float(obj)
     raise TypeError
 
+def to_decimal(value):
+    """Convert a JSON number to a Decimal; ints convert exactly, others go through str to avoid binary float noise"""
+    if isinstance(value, int):
+        return Decimal(value)
+    return Decimal(str(value))
+
+def to_json(obj, indent=False):
+    """Serialize a response body with orjson; decimal_default only catches Decimals not demoted at read time"""
+    option = orjson.OPT_INDENT_2 if indent else 0
+    return orjson.dumps(obj, default=decimal_default, option=option).decode('utf-8')
+
+def parse_body(event):
+    """Decode the JSON request body, which API Gateway base64-encodes when binary media types are enabled"""
+    body = event.get('body') or '{}'
+    if event.get('isBase64Encoded'):
+        body = base64.b64decode(body)
+    return orjson.loads(body)
+
+def request_header(event, name):
+    """Read a request header whether the client sent it canonical-cased or lowercased"""
+    request_headers = event.get('headers') or {}
+    return request_headers.get(name) or request_headers.get(name.lower())
+
+def body_etag(body):
+    """Strong ETag for a serialized response body"""
+    return '"' + hashlib.blake2b(body.encode('utf-8'), digest_size=8).hexdigest() + '"'
+
+def accepts_gzip(event):
+    """Whether the client advertised gzip in Accept-Encoding"""
+    return 'gzip' in (request_header(event, 'Accept-Encoding') or '')
+
+def gzip_etag(etag):
+    """ETag of the gzip-encoded variant; a strong validator must differ between content codings"""
+    return etag[:-1] + '-gzip"'
+
+def will_compress(event, response):
+    """Whether compress_response is going to gzip this response"""
+    body = response.get('body')
+    return bool(body) and len(body) >= GZIP_MIN_BYTES and not response.get('isBase64Encoded') and accepts_gzip(event)
+
+def revalidate_response(event, response):
+    """Tag a successful GET body with the ETag of the variant the client will receive, answering a matching If-None-Match with a bodyless 304"""
+    if response.get('statusCode') != 200:
+        return response
+    
+    # Handlers that cache their body also cache its ETag; otherwise it is hashed from the body here
+    etag = response['headers'].get('ETag') or body_etag(response['body'])
+    headers = {**response['headers'], 'ETag': etag}
+    if will_compress(event, response):
+        headers.update({'ETag': gzip_etag(etag), 'Vary': 'Accept-Encoding'})
+    if request_header(event, 'If-None-Match') == headers['ETag']:
+        return {'statusCode': 304, 'headers': headers, 'body': ''}
+    return {**response, 'headers': headers}
+
+def compress_response(event, response):
+    """Gzip large response bodies for clients that accept it, base64-encoded for API Gateway"""
+    if not will_compress(event, response):
+        return response
+    
+    body = response['body']
+    compressed = gzip.compress(body.encode('utf-8'), compresslevel=1)
+    return {
+        **response,
+        'headers': {**response['headers'], 'Content-Encoding': 'gzip', 'Vary': 'Accept-Encoding'},
+        'isBase64Encoded': True,
+        'body': base64.b64encode(compressed).decode('ascii')
+    }
+
 def initialize_database():
     """Initialize DynamoDB tables with criteria"""
+    global _DB_INITIALIZED
+    if _DB_INITIALIZED:
+        return
+    
     try:
-        # Initialize criteria (always needed)
-        criteria_response = criteria_table.scan(Select='COUNT')
-        if criteria_response['Count'] == 0:
-            criteria_data = [
-                {"id": "1", "name": "Problem Understanding", "weight": Decimal('15'), "max_score": 1},
-                {"id": "2", "name": "Success Criteria Definition", "weight": Decimal('15'), "max_score": 1},
-                {"id": "3", "name": "Demo Relevance", "weight": Decimal('15'), "max_score": 1},
-                {"id": "4", "name": "Service Correlation", "weight": Decimal('15'), "max_score": 1},
-                {"id": "5", "name": "GenAI Services Usage", "weight": Decimal('15'), "max_score": 1},
-                {"id": "6", "name": "Team Collaboration", "weight": Decimal('10'), "max_score": 1},
-                {"id": "7", "name": "Notes of Unanswered Questions", "weight": Decimal('15'), "max_score": 1}
-            ]
-            
-            for criteria in criteria_data:
-                criteria_table.put_item(Item=criteria)
+        # Initialize criteria (always needed); reading at most one item is enough to tell
+        # whether the table is empty, and a truncated page means it is not
+        criteria_response = criteria_table.scan(Select='COUNT', Limit=1)
+        if criteria_response['Count'] == 0 and 'LastEvaluatedKey' not in criteria_response:
+            # batch_writer groups puts into BatchWriteItem calls and retries unprocessed items
+            with criteria_table.batch_writer() as batch:
+                for criteria in DEFAULT_CRITERIA:
+                    batch.put_item(Item=criteria)
+            settings_table.put_item(Item={'key': 'criteria_seq', 'value': Decimal(len(DEFAULT_CRITERIA))})
             logger.info("Added criteria")
         
+        _DB_INITIALIZED = True
+        
     except Exception as e:
         logger.error(f"Error initializing database: {str(e)}")
         raise
 
-def lambda_handler(event, context):
+def get_teams(event, context):
+    """List all teams"""
+    return {
+        'statusCode': 200,
+        'headers': JSON_HEADERS,
+        'body': to_json(scan_all(teams_table))
+    }
+
+def create_team(event, context):
+    """Create a team"""
+    body = parse_body(event)
+    name = body.get('name', '').strip()
+    problem_statement = body.get('problem_statement', '').strip()
+    success_criteria = body.get('success_criteria', '').strip()
+    
+    if not name:
+        return {
+            'statusCode': 400,
+            'headers': JSON_HEADERS,
+            'body': to_json({'error': 'Team name is required'})
+        }
+    
+    team_id = str(uuid.uuid4())
+    team = {
+        'id': team_id,
+        'name': name,
+        'problem_statement': problem_statement,
+        'success_criteria': success_criteria,
+        'competition_id': '1',
+        'created_at': datetime.now().isoformat()
+    }
+    
+    teams_table.put_item(Item=team)
+    
+    return {
+        'statusCode': 200,
+        'headers': JSON_HEADERS,
+        'body': to_json({**team, 'message': 'Team added successfully'})
+    }
+
+def get_judges(event, context):
+    """List all judges"""
+    judges = scan_all(judges_table)
+    return {
+        'statusCode': 200,
+        'headers': JSON_HEADERS,
+        'body': to_json(judges)
+    }
+
+def create_judge(event, context):
+    """Create a judge"""
+    body = parse_body(event)
+    name = body.get('name', '').strip()
+    email = body.get('email', '').strip()
+    role = body.get('role', '').strip()
+    
+    if not name or not email:
+        return {
+            'statusCode': 400,
+            'headers': JSON_HEADERS,
+            'body': to_json({'error': 'Name and email are required'})
+        }
+    
+    judge_id = str(uuid.uuid4())
+    judge = {
+        'id': judge_id,
+        'name': name,
+        'email': email,
+        'role': role,
+        'created_at': datetime.now().isoformat()
+    }
+    
+    judges_table.put_item(Item=judge)
+    
+    return {
+        'statusCode': 200,
+        'headers': JSON_HEADERS,
+        'body': to_json({**judge, 'message': 'Judge added successfully'})
+    }
+
+def get_criteria(event, context):
+    """List all criteria"""
+    # Scanned fresh rather than from the per-container cache: the admin list reloads right after
+    # a write, which may have gone to another container, and unchanged reads cost only a 304
+    criteria = scan_all(criteria_table)
+    return {
+        'statusCode': 200,
+        'headers': JSON_HEADERS,
+        'body': to_json(criteria)
+    }
+
+def get_bootstrap(event, context):
+    """List teams, judges and criteria in one response for the page's initial load"""
+    # Project only what the voting form and the Teams and Judges tabs show
+    name = {'#name': 'name'}
+    teams_future = executor.submit(
+        scan_all, teams_table,
+        ProjectionExpression='id, #name, problem_statement, success_criteria',
+        ExpressionAttributeNames=name
+    )
+    judges_future = executor.submit(
+        scan_all, judges_table,
+        ProjectionExpression='id, #name, email, #role',
+        ExpressionAttributeNames={**name, '#role': 'role'}
+    )
+    criteria = scan_all(criteria_table, ProjectionExpression='id, #name, weight', ExpressionAttributeNames=name)
+    body = to_json({
+        'teams': teams_future.result(),
+        'judges': judges_future.result(),
+        'criteria': criteria
+    })
+    
+    # Browsers revalidate every load, so unchanged data costs a bodyless 304 from revalidate_response
+    return {'statusCode': 200, 'headers': {**JSON_HEADERS, 'Cache-Control': 'no-cache'}, 'body': body}
+
+def create_criteria(event, context):
+    """Create a criteria with the next sequential ID"""
+    body = parse_body(event)
+    name = body.get('name', '').strip()
+    weight = body.get('weight', 0)
+    description = body.get('description', '').strip()
+    
+    if not name or not weight:
+        return {
+            'statusCode': 400,
+            'headers': JSON_HEADERS,
+            'body': to_json({'error': 'Criteria name and weight are required'})
+        }
+    
+    # Generate new criteria ID; the conditional put skips IDs already taken
+    # by criteria created before the counter existed
+    while True:
+        new_id = next_criteria_id()
+        criteria = {
+            'id': new_id,
+            'name': name,
+            'weight': to_decimal(weight),
+            'max_score': 1,
+            'description': description,
+            'created_at': datetime.now().isoformat()
+        }
+        
+        try:
+            criteria_table.put_item(Item=criteria, ConditionExpression='attribute_not_exists(id)')
+            break
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                raise
+    
+    invalidate_criteria_cache()
+    
+    return {
+        'statusCode': 200,
+        'headers': JSON_HEADERS,
+        'body': to_json({**criteria, 'message': 'Criteria added successfully'})
+    }
+
+def delete_criteria(event, context):
+    """Delete a criteria and all votes cast against it"""
+    criteria_id = event.get('path', '').rstrip('/').split('/')[-1]
+    
+    if not criteria_id:
+        return {
+            'statusCode': 400,
+            'headers': JSON_HEADERS,
+            'body': to_json({'error': 'Criteria ID is required'})
+        }
+    
+    # Check if criteria exists
     try:
-        # Initialize database on first call
-        initialize_database()
+        criteria_table.get_item(Key={'id': criteria_id})['Item']
+    except KeyError:
+        return {
+            'statusCode': 404,
+            'headers': JSON_HEADERS,
+            'body': to_json({'error': 'Criteria not found'})
+        }
+    
+    # Delete all votes for this criteria first
+    if VOTES_CRITERIA_INDEX:
+        votes = query_all(
+            votes_table,
+            IndexName=VOTES_CRITERIA_INDEX,
+            KeyConditionExpression='criteria_id = :criteria_id',
+            ExpressionAttributeValues={':criteria_id': criteria_id},
+            ProjectionExpression='id'
+        )
+    else:
+        votes = parallel_scan(
+            votes_table,
+            VOTES_SCAN_SEGMENTS,
+            FilterExpression='criteria_id = :criteria_id',
+            ExpressionAttributeValues={':criteria_id': type_serializer.serialize(criteria_id)},
+            ProjectionExpression='id'
+        )
+    deleted_votes = 0
+    with votes_table.batch_writer() as batch:
+        for vote in votes:
+            batch.delete_item(Key={'id': vote['id']})
+            deleted_votes += 1
+    
+    # Delete the criteria
+    criteria_table.delete_item(Key={'id': criteria_id})
+    invalidate_criteria_cache()
+    
+    return {
+        'statusCode': 200,
+        'headers': JSON_HEADERS,
+        'body': to_json({
+            'message': 'Criteria deleted successfully',
+            'criteria_id': criteria_id,
+            'deleted_votes': deleted_votes
+        })
+    }
+
+def submit_vote(event, context):
+    """Record a single vote"""
+    body = parse_body(event)
+    judge_id = str(body.get('judge_id', ''))
+    team_id = str(body.get('team_id', ''))
+    criteria_id = str(body.get('criteria_id', ''))
+    score = body.get('score', 0)
+    comments = body.get('comments', '')
+    
+    if not all([judge_id, team_id, criteria_id]):
+        return {
+            'statusCode': 400,
+            'headers': JSON_HEADERS,
+            'body': to_json({'error': 'Judge ID, Team ID, and Criteria ID are required'})
+        }
+    
+    vote_id = str(uuid.uuid4())
+    vote = {
+        'id': vote_id,
+        'judge_id': judge_id,
+        'team_id': team_id,
+        'criteria_id': criteria_id,
+        'score': to_decimal(score),
+        'comments': comments,
+        'created_at': datetime.now().isoformat()
+    }
+    
+    votes_table.put_item(Item=vote)
+    
+    return {
+        'statusCode': 200,
+        'headers': JSON_HEADERS,
+        'body': to_json({
+            'message': 'Vote submitted successfully',
+            'judge_id': judge_id,
+            'team_id': team_id,
+            'criteria_id': criteria_id,
+            'score': score
+        })
+    }
+
+def submit_votes(event, context):
+    """Record a judge's votes for a team and queue the confirmation email"""
+    # New endpoint for batch vote submission with email notification
+    body = parse_body(event)
+    judge_id = str(body.get('judge_id', ''))
+    team_id = str(body.get('team_id', ''))
+    votes_data = body.get('votes', [])
+    overwrite_existing = body.get('overwrite_existing', False)
+    
+    if not judge_id or not team_id or not votes_data:
+        return {
+            'statusCode': 400,
+            'headers': JSON_HEADERS,
+            'body': to_json({'error': 'Judge ID, Team ID, and votes data are required'})
+        }
+    
+    try:
+        # Check for existing votes by this judge for this team; one item is enough to know
+        existing_vote_key = {
+            'IndexName': 'judge-team-index',
+            'KeyConditionExpression': 'judge_id = :judge_id AND team_id = :team_id',
+            'ExpressionAttributeValues': {':judge_id': judge_id, ':team_id': team_id}
+        }
+        first_existing_vote = votes_table.query(
+            Limit=1,
+            ProjectionExpression='created_at',
+            **existing_vote_key
+        )['Items']
+        
+        # If votes exist and overwrite is not explicitly allowed, return warning
+        if first_existing_vote and not overwrite_existing:
+            existing_votes_count = count_all(votes_table, **existing_vote_key)
+            return {
+                'statusCode': 409,  # Conflict status code
+                'headers': JSON_HEADERS,
+                'body': to_json({
+                    'error': 'duplicate_votes',
+                    'message': 'You have already voted for this team',
+                    'existing_votes_count': existing_votes_count,
+                    'existing_votes_date': first_existing_vote[0]['created_at'],
+                    'requires_confirmation': True
+                })
+            }
+        
+        # Get judge and team information for email
+        judge_future = executor.submit(judges_table.get_item, Key={'id': judge_id})
+        team_future = executor.submit(teams_table.get_item, Key={'id': team_id})
+        criteria_future = executor.submit(get_cached_criteria)
+        
+        judge_response = judge_future.result()
+        team_response = team_future.result()
+        criteria_items = criteria_future.result()
+        
+        if 'Item' not in judge_response or 'Item' not in team_response:
+            return {
+                'statusCode': 404,
+                'headers': JSON_HEADERS,
+                'body': to_json({'error': 'Judge or team not found'})
+            }
+        
+        judge = judge_response['Item']
+        team = team_response['Item']
+        criteria_dict = {c['id']: c for c in criteria_items}
+        # The cache is per container, so a criterion created through another container in the last
+        # TTL can be missing from it; rescan once rather than label that vote unknown in the email
+        if any(vote_data['criteria_id'] not in criteria_dict for vote_data in votes_data):
+            invalidate_criteria_cache()
+            criteria_dict = {c['id']: c for c in get_cached_criteria()}
+        
+        # If overwriting, delete existing votes first
+        deleted_votes_count = 0
+        if first_existing_vote and overwrite_existing:
+            existing_votes_for_team = query_all(votes_table, ProjectionExpression='id', **existing_vote_key)
+            with votes_table.batch_writer() as batch:
+                for existing_vote in existing_votes_for_team:
+                    batch.delete_item(Key={'id': existing_vote['id']})
+                    deleted_votes_count += 1
+        
+        # Submit all new votes in BatchWriteItem calls
+        submitted_votes = []
+        with votes_table.batch_writer() as batch:
+            for vote_data in votes_data:
+                vote_id = str(uuid.uuid4())
+                vote = {
+                    'id': vote_id,
+                    'judge_id': judge_id,
+                    'team_id': team_id,
+                    'criteria_id': vote_data['criteria_id'],
+                    'score': to_decimal(vote_data['score']),
+                    'comments': vote_data.get('comments', ''),
+                    'created_at': datetime.now().isoformat()
+                }
+                
+                batch.put_item(Item=vote)
+                
+                # Prepare vote data for email
+                criteria = criteria_dict.get(vote_data['criteria_id'], {})
+                submitted_votes.append({
+                    'criteria_name': criteria.get('name', 'Unknown Criteria'),
+                    'score': vote_data['score'],
+                    'comments': vote_data.get('comments', '')
+                })
+        
+        # Queue confirmation email so SES latency stays off the response path
+        email_status = queue_vote_confirmation_email(
+            function_arn=context.invoked_function_arn,
+            judge_email=judge['email'],
+            judge_name=judge['name'],
+            team_name=team['name'],
+            votes_data=submitted_votes
+        )
+        
+        response_data = {
+            'message': 'Votes submitted successfully',
+            'votes_count': len(submitted_votes),
+            'email_status': email_status,
+            'judge_email': judge['email']
+        }
+        
+        # Add overwrite information if applicable
+        if deleted_votes_count > 0:
+            response_data['overwritten_votes'] = deleted_votes_count
+            response_data['action'] = 'overwrite'
+        else:
+            response_data['action'] = 'new'
         
+        return {
+            'statusCode': 200,
+            'headers': JSON_HEADERS,
+            'body': to_json(response_data)
+        }
+        
+    except Exception as e:
+        logger.error(f"Error in batch vote submission: {str(e)}")
+        return {
+            'statusCode': 500,
+            'headers': JSON_HEADERS,
+            'body': to_json({'error': 'Internal server error'})
+        }
+
+def get_votes(event, context):
+    """List all votes enriched with team, judge and criteria names"""
+    votes = parallel_scan(votes_table, VOTES_SCAN_SEGMENTS)
+    
+    # Enrich votes with team and judge names, fetching only the referenced items
+    teams_future = executor.submit(batch_get_by_id, TEAMS_TABLE, {v['team_id'] for v in votes}, ['name'])
+    judges_future = executor.submit(batch_get_by_id, JUDGES_TABLE, {v['judge_id'] for v in votes}, ['name'])
+    criteria_future = executor.submit(batch_get_by_id, CRITERIA_TABLE, {v['criteria_id'] for v in votes}, ['name', 'max_score'])
+    
+    teams_dict = teams_future.result()
+    judges_dict = judges_future.result()
+    criteria_dict = criteria_future.result()
+    
+    for vote in votes:
+        team = teams_dict.get(vote['team_id'], {})
+        judge = judges_dict.get(vote['judge_id'], {})
+        criteria = criteria_dict.get(vote['criteria_id'], {})
+        
+        vote['team_name'] = team.get('name', 'Unknown Team')
+        vote['judge_name'] = judge.get('name', 'Unknown Judge')
+        vote['criteria_name'] = criteria.get('name', 'Unknown Criteria')
+        vote['max_score'] = criteria.get('max_score', 1)
+    
+    return {
+        'statusCode': 200,
+        'headers': JSON_HEADERS,
+        'body': to_json(votes)
+    }
+
+def get_leaderboard(event, context):
+    """Rank teams by their aggregated votes"""
+    # Project only the attributes the ranking uses
+    teams = scan_all(
+        teams_table,
+        ProjectionExpression='id, #name, problem_statement',
+        ExpressionAttributeNames={'#name': 'name'}
+    )
+    
+    # Read each team's votes from the team index concurrently instead of scanning the whole votes table
+    votes_futures = {
+        team['id']: executor.submit(
+            query_all, votes_table,
+            IndexName='team-index',
+            KeyConditionExpression='team_id = :team_id',
+            ExpressionAttributeValues={':team_id': team['id']},
+            ProjectionExpression='judge_id, score'
+        )
+        for team in teams
+    }
+    
+    # Calculate scores for each team
+    team_scores = {}
+    for team in teams:
+        team_id = team['id']
+        
+        # Aggregate the team's votes per judge in a single pass
+        totals = {'score': 0, 'count': 0, 'yes': 0, 'judges': {}}
+        for vote in votes_futures[team_id].result():
+            score = float(vote['score'])
+            # Total score = simple sum of Yes votes (1 for Yes, 0 for No)
+            totals['score'] += score
+            totals['count'] += 1
+            is_yes = 1 if score == 1 else 0
+            totals['yes'] += is_yes
+            judge_counts = totals['judges'].setdefault(vote['judge_id'], [0, 0])
+            judge_counts[0] += is_yes
+            judge_counts[1] += 1
+        
+        total_score = totals['score']
+        vote_count = totals['count']
+        judge_count = len(totals['judges'])
+        
+        average_score = total_score / vote_count if vote_count > 0 else 0
+        # Calculate average percentage across judges
+        judge_percentages = [(judge_yes / judge_total) * 100 for judge_yes, judge_total in totals['judges'].values()]
+        weighted_percentage = sum(judge_percentages) / len(judge_percentages) if judge_percentages else 0
+        
+        team_scores[team_id] = {
+            'id': team['id'],
+            'team_name': team['name'],
+            'problem_statement': team.get('problem_statement', ''),
+            'total_yes_votes': totals['yes'],
+            'total_possible_votes': vote_count,
+            'total_score': total_score,
+            'average_score': average_score,
+            'vote_count': vote_count,
+            'judge_count': judge_count,
+            'weighted_percentage': weighted_percentage,
+            # Pre-formatted for display so the page renders them verbatim
+            'total_score_fmt': f"{total_score:.1f}",
+            'weighted_percentage_fmt': f"{weighted_percentage:.1f}%"
+        }
+    
+    # Sort by total score descending
+    leaderboard = sorted(team_scores.values(), 
+                       key=lambda x: (x['total_score'], x['weighted_percentage'], x['average_score']), 
+                       reverse=True)
+    
+    return {
+        'statusCode': 200,
+        'headers': JSON_HEADERS,
+        'body': to_json(leaderboard)
+    }
+
+def clear_table(table):
+    """Delete every item of an id-keyed table in batches and return how many were removed"""
+    deleted = 0
+    with table.batch_writer() as batch:
+        for item in iter_scan(table, ProjectionExpression='id'):
+            batch.delete_item(Key={'id': item['id']})
+            deleted += 1
+    return deleted
+
+def clear_sample_data(event, context):
+    """Delete all teams, judges and votes"""
+    # The tables are independent, so clear them concurrently
+    votes_future = executor.submit(clear_table, votes_table)
+    teams_future = executor.submit(clear_table, teams_table)
+    judges_future = executor.submit(clear_table, judges_table)
+    
+    deleted_votes = votes_future.result()
+    deleted_teams = teams_future.result()
+    deleted_judges = judges_future.result()
+    
+    # Set clear flags in a single batch
+    with settings_table.batch_writer() as batch:
+        batch.put_item(Item={'key': 'sample_data_cleared', 'value': 'true'})
+        batch.put_item(Item={'key': 'data_cleared_at', 'value': datetime.now().isoformat()})
+        batch.put_item(Item={'key': 'user_managed', 'value': 'true'})
+    
+    return {
+        'statusCode': 200,
+        'headers': JSON_HEADERS,
+        'body': to_json({
+            'message': 'All data cleared successfully',
+            'deleted_teams': deleted_teams,
+            'deleted_judges': deleted_judges,
+            'deleted_votes': deleted_votes,
+            'reset_counters': True
+        })
+    }
+
+def build_debug_counts():
+    """Serialize the table counts, using COUNT scans that return no items"""
+    count_futures = {
+        name: executor.submit(count_scan, table)
+        for name, table in (('teams', teams_table), ('judges', judges_table), ('votes', votes_table), ('criteria', criteria_table))
+    }
+    return to_json({'counts': {name: future.result() for name, future in count_futures.items()}})
+
+def build_debug_state(pretty):
+    """Serialize the database state and table counts"""
+    # Get all data concurrently; the projections already trim each item to the reported
+    # attributes, so the scanned items go to the encoder as they are. Settings have known
+    # keys and criteria are cached, so neither needs a scan.
+    id_name = {'ProjectionExpression': 'id, #name', 'ExpressionAttributeNames': {'#name': 'name'}}
+    teams_future = executor.submit(scan_all, teams_table, **id_name)
+    judges_future = executor.submit(scan_all, judges_table, **id_name)
+    settings_future = executor.submit(batch_get_by_id, SETTINGS_TABLE, SETTINGS_KEYS, ['value'], key='key')
+    votes = parallel_scan(votes_table, VOTES_SCAN_SEGMENTS, ProjectionExpression='id, judge_id, team_id, criteria_id, score')
+    criteria = [{'id': c['id'], 'name': c['name']} for c in get_cached_criteria()]
+    teams = teams_future.result()
+    judges = judges_future.result()
+    settings = list(settings_future.result().values())
+    
+    return to_json({
+        'database_state': {
+            'teams': teams,
+            'judges': judges,
+            'votes': votes,
+            'criteria': criteria,
+            'settings': settings
+        },
+        'counts': {
+            'teams': len(teams),
+            'judges': len(judges),
+            'votes': len(votes),
+            'criteria': len(criteria)
+        }
+    }, indent=pretty)
+
+def debug_db(event, context):
+    """Dump the database state and table counts, revalidated with an ETag"""
+    query_params = event.get('queryStringParameters') or {}
+    # Status panels only need the counts; ?pretty=1 keeps the indented dump for humans
+    counts_only = query_params.get('counts_only') == '1'
+    pretty = query_params.get('pretty') == '1'
+    
+    # Polling clients reuse the last body for a couple of seconds instead of rescanning
+    cached = _debug_cache.get((counts_only, pretty))
+    if cached is None or time.time() - cached['built_at'] >= DEBUG_CACHE_TTL:
+        body = build_debug_counts() if counts_only else build_debug_state(pretty)
+        cached = {
+            'etag': body_etag(body),
+            'body': body,
+            'built_at': time.time()
+        }
+        _debug_cache[(counts_only, pretty)] = cached
+    
+    # revalidate_response answers a matching If-None-Match from the cached ETag
+    return {'statusCode': 200, 'headers': {**JSON_HEADERS, 'ETag': cached['etag']}, 'body': cached['body']}
+
+# Exact (method, path) routes and (method, prefix) routes for paths carrying an ID
+ROUTES = {
+    ('GET', '/teams'): get_teams,
+    ('POST', '/teams'): create_team,
+    ('GET', '/judges'): get_judges,
+    ('POST', '/judges'): create_judge,
+    ('GET', '/criteria'): get_criteria,
+    ('POST', '/criteria'): create_criteria,
+    ('GET', '/bootstrap'): get_bootstrap,
+    ('POST', '/vote'): submit_vote,
+    ('POST', '/submit-votes'): submit_votes,
+    ('GET', '/votes'): get_votes,
+    ('GET', '/leaderboard'): get_leaderboard,
+    ('POST', '/clear-sample-data'): clear_sample_data,
+    ('GET', '/debug-db'): debug_db
+}
+PREFIX_ROUTES = {
+    ('DELETE', '/criteria/'): delete_criteria
+}
+
+def lambda_handler(event, context):
+    # Asynchronous email jobs queued by /submit-votes; transient SES failures raise so Lambda retries the
+    # job, and jobs that run out of retries land in the email failure queue
+    if 'email_job' in event:
+        return {'email_sent': send_vote_confirmation_email(**event['email_job'], raise_retryable=True)}
+    
+    try:
         # Handle CORS preflight
         if event.get('httpMethod') == 'OPTIONS':
             return {
                 'statusCode': 200,
-                'headers': get_security_headers(),
+                'headers': SECURITY_HEADERS,
                 'body': ''
             }
         
@@ -230,2145 +1188,128 @@ def lambda_handler(event, context):
         
         # Handle main page
         if path == '' or path == '/':
-            return serve_main_page()
+            return serve_main_page(event)
+        
+        # Bundled static files need no database either
+        if path.startswith(STATIC_PREFIX) and path[len(STATIC_PREFIX):] in STATIC_FILES:
+            return serve_static_file(event, path[len(STATIC_PREFIX):])
+        
+        # Initialize database on first API call (no-op once the container is warm)
+        initialize_database()
         
         # Remove /api prefix if present
         if path.startswith('/api'):
             path = path[4:]
         
         # API Routes
-        if method == 'GET' and path == '/teams':
-            response = teams_table.scan()
-            teams = response['Items']
-            for team in teams:
-                team['competition_name'] = 'Ignite Innovative GenAI Training'
-            return {
-                'statusCode': 200,
-                'headers': {'Content-Type': 'application/json', **get_security_headers()},
-                'body': json.dumps(teams, default=decimal_default)
-            }
-        
-        elif method == 'POST' and path == '/teams':
-            body = json.loads(event.get('body', '{}'))
-            name = body.get('name', '').strip()
-            problem_statement = body.get('problem_statement', '').strip()
-            success_criteria = body.get('success_criteria', '').strip()
-            
-            if not name:
-                return {
-                    'statusCode': 400,
-                    'headers': {'Content-Type': 'application/json', **get_security_headers()},
-                    'body': json.dumps({'error': 'Team name is required'})
-                }
-            
-            team_id = str(uuid.uuid4())
-            team = {
-                'id': team_id,
-                'name': name,
-                'problem_statement': problem_statement,
-                'success_criteria': success_criteria,
-                'competition_id': '1',
-                'created_at': datetime.now().isoformat()
-            }
-            
-            teams_table.put_item(Item=team)
-            
-            return {
-                'statusCode': 200,
-                'headers': {'Content-Type': 'application/json', **get_security_headers()},
-                'body': json.dumps({'id': team_id, 'name': name, 'description': description, 'message': 'Team added successfully'})
-            }
-        
-        elif method == 'GET' and path == '/judges':
-            response = judges_table.scan()
-            judges = response['Items']
-            return {
-                'statusCode': 200,
-                'headers': {'Content-Type': 'application/json', **get_security_headers()},
-                'body': json.dumps(judges, default=decimal_default)
-            }
-        
-        elif method == 'POST' and path == '/judges':
-            body = json.loads(event.get('body', '{}'))
-            name = body.get('name', '').strip()
-            email = body.get('email', '').strip()
-            role = body.get('role', '').strip()
-            
-            if not name or not email:
-                return {
-                    'statusCode': 400,
-                    'headers': {'Content-Type': 'application/json', **get_security_headers()},
-                    'body': json.dumps({'error': 'Name and email are required'})
-                }
-            
-            judge_id = str(uuid.uuid4())
-            judge = {
-                'id': judge_id,
-                'name': name,
-                'email': email,
-                'role': role,
-                'created_at': datetime.now().isoformat()
-            }
-            
-            judges_table.put_item(Item=judge)
-            
-            return {
-                'statusCode': 200,
-                'headers': {'Content-Type': 'application/json', **get_security_headers()},
-                'body': json.dumps({'id': judge_id, 'name': name, 'email': email, 'role': role, 'message': 'Judge added successfully'})
-            }
-        
-        elif method == 'GET' and path == '/criteria':
-            response = criteria_table.scan()
-            criteria = response['Items']
-            return {
-                'statusCode': 200,
-                'headers': {'Content-Type': 'application/json', **get_security_headers()},
-                'body': json.dumps(criteria, default=decimal_default)
-            }
-        
-        elif method == 'POST' and path == '/criteria':
-            body = json.loads(event.get('body', '{}'))
-            name = body.get('name', '').strip()
-            weight = body.get('weight', 0)
-            description = body.get('description', '').strip()
-            
-            if not name or not weight:
-                return {
-                    'statusCode': 400,
-                    'headers': {'Content-Type': 'application/json', **get_security_headers()},
-                    'body': json.dumps({'error': 'Criteria name and weight are required'})
-                }
-            
-            # Generate new criteria ID
-            existing_criteria = criteria_table.scan()['Items']
-            max_id = max([int(c['id']) for c in existing_criteria] + [0])
-            new_id = str(max_id + 1)
-            
-            criteria = {
-                'id': new_id,
-                'name': name,
-                'weight': Decimal(str(weight)),
-                'max_score': 1,
-                'description': description,
-                'created_at': datetime.now().isoformat()
-            }
-            
-            criteria_table.put_item(Item=criteria)
-            
-            return {
-                'statusCode': 200,
-                'headers': {'Content-Type': 'application/json', **get_security_headers()},
-                'body': json.dumps({'id': new_id, 'name': name, 'weight': weight, 'description': description, 'message': 'Criteria added successfully'})
-            }
-        
-        elif method == 'DELETE' and path.startswith('/criteria/'):
-            criteria_id = path.split('/')[-1]
-            
-            if not criteria_id:
-                return {
-                    'statusCode': 400,
-                    'headers': {'Content-Type': 'application/json', **get_security_headers()},
-                    'body': json.dumps({'error': 'Criteria ID is required'})
-                }
-            
-            # Check if criteria exists
-            try:
-                criteria_table.get_item(Key={'id': criteria_id})['Item']
-            except KeyError:
-                return {
-                    'statusCode': 404,
-                    'headers': {'Content-Type': 'application/json', **get_security_headers()},
-                    'body': json.dumps({'error': 'Criteria not found'})
-                }
-            
-            # Delete all votes for this criteria first
-            votes_response = votes_table.scan()
-            deleted_votes = 0
-            for vote in votes_response['Items']:
-                if vote['criteria_id'] == criteria_id:
-                    votes_table.delete_item(Key={'id': vote['id']})
-                    deleted_votes += 1
-            
-            # Delete the criteria
-            criteria_table.delete_item(Key={'id': criteria_id})
-            
-            return {
-                'statusCode': 200,
-                'headers': {'Content-Type': 'application/json', **get_security_headers()},
-                'body': json.dumps({
-                    'message': 'Criteria deleted successfully',
-                    'criteria_id': criteria_id,
-                    'deleted_votes': deleted_votes
-                })
-            }
-        
-        elif method == 'POST' and path == '/vote':
-            body = json.loads(event.get('body', '{}'))
-            judge_id = str(body.get('judge_id', ''))
-            team_id = str(body.get('team_id', ''))
-            criteria_id = str(body.get('criteria_id', ''))
-            score = body.get('score', 0)
-            comments = body.get('comments', '')
-            
-            if not all([judge_id, team_id, criteria_id]):
-                return {
-                    'statusCode': 400,
-                    'headers': {'Content-Type': 'application/json', **get_security_headers()},
-                    'body': json.dumps({'error': 'Judge ID, Team ID, and Criteria ID are required'})
-                }
-            
-            vote_id = str(uuid.uuid4())
-            vote = {
-                'id': vote_id,
-                'judge_id': judge_id,
-                'team_id': team_id,
-                'criteria_id': criteria_id,
-                'score': Decimal(str(score)),
-                'comments': comments,
-                'created_at': datetime.now().isoformat()
-            }
-            
-            votes_table.put_item(Item=vote)
-            
-            return {
-                'statusCode': 200,
-                'headers': {'Content-Type': 'application/json', **get_security_headers()},
-                'body': json.dumps({
-                    'message': 'Vote submitted successfully',
-                    'judge_id': judge_id,
-                    'team_id': team_id,
-                    'criteria_id': criteria_id,
-                    'score': score
-                })
-            }
-        
-        elif method == 'POST' and path == '/submit-votes':
-            # New endpoint for batch vote submission with email notification
-            body = json.loads(event.get('body', '{}'))
-            judge_id = str(body.get('judge_id', ''))
-            team_id = str(body.get('team_id', ''))
-            votes_data = body.get('votes', [])
-            overwrite_existing = body.get('overwrite_existing', False)
-            
-            if not judge_id or not team_id or not votes_data:
-                return {
-                    'statusCode': 400,
-                    'headers': {'Content-Type': 'application/json', **get_security_headers()},
-                    'body': json.dumps({'error': 'Judge ID, Team ID, and votes data are required'})
-                }
-            
-            try:
-                # Check for existing votes by this judge for this team
-                existing_votes_response = votes_table.query(
-                    IndexName='judge-index',
-                    KeyConditionExpression='judge_id = :judge_id',
-                    ExpressionAttributeValues={':judge_id': judge_id}
-                )
-                
-                existing_votes_for_team = [
-                    vote for vote in existing_votes_response['Items'] 
-                    if vote['team_id'] == team_id
-                ]
-                
-                # If votes exist and overwrite is not explicitly allowed, return warning
-                if existing_votes_for_team and not overwrite_existing:
-                    return {
-                        'statusCode': 409,  # Conflict status code
-                        'headers': {'Content-Type': 'application/json', **get_security_headers()},
-                        'body': json.dumps({
-                            'error': 'duplicate_votes',
-                            'message': 'You have already voted for this team',
-                            'existing_votes_count': len(existing_votes_for_team),
-                            'existing_votes_date': existing_votes_for_team[0]['created_at'] if existing_votes_for_team else None,
-                            'requires_confirmation': True
-                        })
-                    }
-                
-                # Get judge and team information for email
-                judge_response = judges_table.get_item(Key={'id': judge_id})
-                team_response = teams_table.get_item(Key={'id': team_id})
-                criteria_response = criteria_table.scan()
-                
-                if 'Item' not in judge_response or 'Item' not in team_response:
-                    return {
-                        'statusCode': 404,
-                        'headers': {'Content-Type': 'application/json', **get_security_headers()},
-                        'body': json.dumps({'error': 'Judge or team not found'})
-                    }
-                
-                judge = judge_response['Item']
-                team = team_response['Item']
-                criteria_dict = {c['id']: c for c in criteria_response['Items']}
-                
-                # If overwriting, delete existing votes first
-                deleted_votes_count = 0
-                if existing_votes_for_team and overwrite_existing:
-                    for existing_vote in existing_votes_for_team:
-                        votes_table.delete_item(Key={'id': existing_vote['id']})
-                        deleted_votes_count += 1
-                
-                # Submit all new votes
-                submitted_votes = []
-                for vote_data in votes_data:
-                    vote_id = str(uuid.uuid4())
-                    vote = {
-                        'id': vote_id,
-                        'judge_id': judge_id,
-                        'team_id': team_id,
-                        'criteria_id': vote_data['criteria_id'],
-                        'score': Decimal(str(vote_data['score'])),
-                        'comments': vote_data.get('comments', ''),
-                        'created_at': datetime.now().isoformat()
-                    }
-                    
-                    votes_table.put_item(Item=vote)
-                    
-                    # Prepare vote data for email
-                    criteria = criteria_dict.get(vote_data['criteria_id'], {})
-                    submitted_votes.append({
-                        'criteria_name': criteria.get('name', 'Unknown Criteria'),
-                        'score': vote_data['score'],
-                        'comments': vote_data.get('comments', '')
-                    })
-                
-                # Send confirmation email
-                email_sent = send_vote_confirmation_email(
-                    judge_email=judge['email'],
-                    judge_name=judge['name'],
-                    team_name=team['name'],
-                    votes_data=submitted_votes
-                )
-                
-                response_data = {
-                    'message': 'Votes submitted successfully',
-                    'votes_count': len(submitted_votes),
-                    'email_sent': email_sent,
-                    'judge_email': judge['email']
-                }
-                
-                # Add overwrite information if applicable
-                if deleted_votes_count > 0:
-                    response_data['overwritten_votes'] = deleted_votes_count
-                    response_data['action'] = 'overwrite'
-                else:
-                    response_data['action'] = 'new'
-                
-                return {
-                    'statusCode': 200,
-                    'headers': {'Content-Type': 'application/json', **get_security_headers()},
-                    'body': json.dumps(response_data)
-                }
-                
-            except Exception as e:
-                logger.error(f"Error in batch vote submission: {str(e)}")
-                return {
-                    'statusCode': 500,
-                    'headers': {'Content-Type': 'application/json', **get_security_headers()},
-                    'body': json.dumps({'error': 'Internal server error'})
-                }
-        
-        elif method == 'GET' and path == '/votes':
-            response = votes_table.scan()
-            votes = response['Items']
-            
-            # Enrich votes with team and judge names
-            teams_response = teams_table.scan()
-            judges_response = judges_table.scan()
-            criteria_response = criteria_table.scan()
-            
-            teams_dict = {team['id']: team for team in teams_response['Items']}
-            judges_dict = {judge['id']: judge for judge in judges_response['Items']}
-            criteria_dict = {criteria['id']: criteria for criteria in criteria_response['Items']}
-            
-            for vote in votes:
-                team = teams_dict.get(vote['team_id'], {})
-                judge = judges_dict.get(vote['judge_id'], {})
-                criteria = criteria_dict.get(vote['criteria_id'], {})
-                
-                vote['team_name'] = team.get('name', 'Unknown Team')
-                vote['judge_name'] = judge.get('name', 'Unknown Judge')
-                vote['criteria_name'] = criteria.get('name', 'Unknown Criteria')
-                vote['max_score'] = criteria.get('max_score', 1)
-            
-            return {
-                'statusCode': 200,
-                'headers': {'Content-Type': 'application/json', **get_security_headers()},
-                'body': json.dumps(votes, default=decimal_default)
-            }
-        
-        elif method == 'GET' and path == '/leaderboard':
-            # Get all data
-            teams_response = teams_table.scan()
-            votes_response = votes_table.scan()
-            criteria_response = criteria_table.scan()
-            
-            teams = teams_response['Items']
-            votes = votes_response['Items']
-            criteria = criteria_response['Items']
-            
-            # Create criteria lookup
-            criteria_dict = {c['id']: c for c in criteria}
-            
-            # Calculate scores for each team
-            team_scores = {}
-            for team in teams:
-                team_id = team['id']
-                team_votes = [v for v in votes if v['team_id'] == team_id]
-                
-                total_score = 0
-                vote_count = len(team_votes)
-                judge_count = len(set(v['judge_id'] for v in team_votes))
-                
-                for vote in team_votes:
-                    # Total score = simple sum of Yes votes (1 for Yes, 0 for No)
-                    total_score += float(vote['score'])
-                
-                average_score = sum(float(v['score']) for v in team_votes) / vote_count if vote_count > 0 else 0
-                # Calculate average percentage across judges
-                judge_percentages = []
-                for judge_id in set(v["judge_id"] for v in team_votes):
-                    judge_votes_list = [v for v in team_votes if v["judge_id"] == judge_id]
-                    judge_yes = sum(1 for v in judge_votes_list if float(v["score"]) == 1)
-                    judge_total = len(judge_votes_list)
-                    if judge_total > 0:
-                        judge_percentages.append((judge_yes / judge_total) * 100)
-                weighted_percentage = sum(judge_percentages) / len(judge_percentages) if judge_percentages else 0
-                
-                # Calculate total Yes votes across all judges
-                total_yes_votes = sum(1 for v in team_votes if float(v["score"]) == 1)
-                total_possible_votes = len(team_votes)
-                
-                team_scores[team_id] = {
-                    'id': team['id'],
-                    'team_name': team['name'],
-                    'description': team.get('description', ''),
-                    'total_yes_votes': total_yes_votes,
-                    'total_possible_votes': total_possible_votes,
-                    'total_score': total_score,
-                    'average_score': average_score,
-                    'vote_count': vote_count,
-                    'judge_count': judge_count,
-                    'weighted_percentage': weighted_percentage
-                }
-            
-            # Sort by total score descending
-            leaderboard = sorted(team_scores.values(), 
-                               key=lambda x: (x['total_score'], x['weighted_percentage'], x['average_score']), 
-                               reverse=True)
-            
-            return {
-                'statusCode': 200,
-                'headers': {'Content-Type': 'application/json', **get_security_headers()},
-                'body': json.dumps(leaderboard, default=decimal_default)
-            }
-        
-        elif method == 'POST' and path == '/clear-sample-data':
-            # Clear all data
-            deleted_teams = 0
-            deleted_judges = 0
-            deleted_votes = 0
-            
-            # Clear votes
-            votes_response = votes_table.scan()
-            for vote in votes_response['Items']:
-                votes_table.delete_item(Key={'id': vote['id']})
-                deleted_votes += 1
-            
-            # Clear teams
-            teams_response = teams_table.scan()
-            for team in teams_response['Items']:
-                teams_table.delete_item(Key={'id': team['id']})
-                deleted_teams += 1
-            
-            # Clear judges
-            judges_response = judges_table.scan()
-            for judge in judges_response['Items']:
-                judges_table.delete_item(Key={'id': judge['id']})
-                deleted_judges += 1
-            
-            # Set clear flags
-            settings_table.put_item(Item={'key': 'sample_data_cleared', 'value': 'true'})
-            settings_table.put_item(Item={'key': 'data_cleared_at', 'value': datetime.now().isoformat()})
-            settings_table.put_item(Item={'key': 'user_managed', 'value': 'true'})
-            
-            return {
-                'statusCode': 200,
-                'headers': {'Content-Type': 'application/json', **get_security_headers()},
-                'body': json.dumps({
-                    'message': 'All data cleared successfully',
-                    'deleted_teams': deleted_teams,
-                    'deleted_judges': deleted_judges,
-                    'deleted_votes': deleted_votes,
-                    'reset_counters': True
-                })
-            }
-        
-        elif method == 'GET' and path == '/debug-db':
-            # Get all data
-            teams_response = teams_table.scan()
-            judges_response = judges_table.scan()
-            votes_response = votes_table.scan()
-            criteria_response = criteria_table.scan()
-            settings_response = settings_table.scan()
-            
-            teams = [{'id': t['id'], 'name': t['name']} for t in teams_response['Items']]
-            judges = [{'id': j['id'], 'name': j['name']} for j in judges_response['Items']]
-            votes = [{'id': v['id'], 'judge_id': v['judge_id'], 'team_id': v['team_id'], 'criteria_id': v['criteria_id'], 'score': float(v['score'])} for v in votes_response['Items']]
-            criteria = [{'id': c['id'], 'name': c['name']} for c in criteria_response['Items']]
-            settings = [{'key': s['key'], 'value': s['value']} for s in settings_response['Items']]
-            
-            return {
-                'statusCode': 200,
-                'headers': {'Content-Type': 'application/json', **get_security_headers()},
-                'body': json.dumps({
-                    'database_state': {
-                        'teams': teams,
-                        'judges': judges,
-                        'votes': votes,
-                        'criteria': criteria,
-                        'settings': settings
-                    },
-                    'counts': {
-                        'teams': len(teams),
-                        'judges': len(judges),
-                        'votes': len(votes),
-                        'criteria': len(criteria)
-                    }
-                }, indent=2)
-            }
+        handler = ROUTES.get((method, path))
+        if handler is None:
+            for (route_method, prefix), prefix_handler in PREFIX_ROUTES.items():
+                if method == route_method and path.startswith(prefix):
+                    handler = prefix_handler
+                    break
+        if handler is not None:
+            # Any write makes the cached /debug-db bodies stale
+            if method != 'GET':
+                _debug_cache.clear()
+            response = handler(event, context)
+            if method == 'GET':
+                response = revalidate_response(event, response)
+            return compress_response(event, response)
         
         # 404 for unknown routes
         return {
             'statusCode': 404,
-            'headers': {'Content-Type': 'application/json', **get_security_headers()},
-            'body': json.dumps({'error': f'Not found: {method} {path}'})
+            'headers': JSON_HEADERS,
+            'body': to_json({'error': f'Not found: {method} {path}'})
         }
         
     except Exception as e:
         logger.error(f"Error: {str(e)}", exc_info=True)
         return {
             'statusCode': 500,
-            'headers': {'Content-Type': 'application/json', **get_security_headers()},
-            'body': json.dumps({'error': 'Internal server error'})
+            'headers': JSON_HEADERS,
+            'body': to_json({'error': 'Internal server error'})
         }
 
-def serve_main_page():
-    """Serve the complete voting application with full interface"""
+def serve_main_page(event):
+    """Serve the prebuilt main page, pre-gzipped for clients that accept it and revalidated with an ETag"""
+    gzipped = accepts_gzip(event)
+    headers = MAIN_PAGE_GZIP_HEADERS if gzipped else MAIN_PAGE_HEADERS
+    if request_header(event, 'If-None-Match') == headers['ETag']:
+        return {'statusCode': 304, 'headers': headers, 'body': ''}
+    if gzipped:
+        return {
+            'statusCode': 200,
+            'headers': headers,
+            'isBase64Encoded': True,
+            'body': MAIN_PAGE_GZIP_BODY
+        }
     return {
         'statusCode': 200,
-        'headers': {
-            'Content-Type': 'text/html',
-            **get_security_headers()
-        },
-        'body': '''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Ignite Innovative GenAI Training - Voting System</title>
-    <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css" rel="stylesheet">
-    <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" rel="stylesheet">
-    <style>
-        .hero-section { 
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
-            color: white; 
-            padding: 3rem 0; 
-        }
-        .card { 
-            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1); 
-            border: none; 
-            margin-bottom: 1.5rem; 
-        }
-        .nav-tabs .nav-link.active { 
-            background-color: #667eea; 
-            border-color: #667eea; 
-            color: white; 
-        }
-        .btn-primary { 
-            background-color: #667eea; 
-            border-color: #667eea; 
-        }
-        .btn-primary:hover { 
-            background-color: #5a6fd8; 
-            border-color: #5a6fd8; 
-        }
-        .leaderboard-item { 
-            transition: all 0.3s ease; 
-        }
-        .leaderboard-item:hover { 
-            transform: translateY(-2px); 
-            box-shadow: 0 6px 12px rgba(0, 0, 0, 0.15); 
-        }
-        .score-badge { 
-            font-size: 1.2rem; 
-            padding: 0.5rem 1rem; 
-        }
-        .logo-container {
-            transition: transform 0.3s ease;
-        }
-        .logo-container:hover {
-            transform: scale(1.05);
-        }
-        .logo-container svg {
-            filter: drop-shadow(0 4px 8px rgba(0, 0, 0, 0.2));
-        }
-        .fsi-banner {
-            background: linear-gradient(135deg, #FF9900 0%, #232F3E 100%);
-            color: white;
-            border-bottom: 3px solid #232F3E;
-            box-shadow: 0 2px 10px rgba(0, 0, 0, 0.1);
-        }
-        .fsi-title {
-            font-size: 2.5rem;
-            font-weight: bold;
-            color: white;
-            text-shadow: 2px 2px 4px rgba(0, 0, 0, 0.3);
-        }
-        .hackaton-title {
-            font-size: 2rem;
-            font-weight: bold;
-            color: white;
-            text-shadow: 2px 2px 4px rgba(0, 0, 0, 0.3);
-            letter-spacing: 2px;
-        }
-        .powered-by {
-            font-size: 0.9rem;
-            color: rgba(255, 255, 255, 0.8);
-            font-weight: 500;
-        }
-        .ignite-sticker-rocket {
-            transition: transform 0.3s ease;
-        }
-        .ignite-sticker-rocket:hover {
-            transform: scale(1.05);
-        }
-        .ignite-sticker-rocket img {
-            filter: drop-shadow(0 0 15px rgba(255, 153, 0, 0.8)) drop-shadow(0 0 25px rgba(255, 153, 0, 0.5));
-            border-radius: 10px;
-        }
-        .ignite-sticker-flame {
-            transition: transform 0.3s ease;
-        }
-        .ignite-sticker-flame:hover {
-            transform: scale(1.05);
-        }
-        .ignite-sticker-flame img {
-            filter: drop-shadow(0 0 15px rgba(255, 215, 0, 0.8)) drop-shadow(0 0 25px rgba(255, 215, 0, 0.5));
-            border-radius: 10px;
-        }
-        .auto-expand-textarea {
-            transition: height 0.2s ease;
-            line-height: 1.4;
-        }
-        .auto-expand-textarea:focus {
-            box-shadow: 0 0 0 0.2rem rgba(102, 126, 234, 0.25);
-            border-color: #667eea;
-        }
-        @media (max-width: 768px) {
-            .fsi-title {
-                font-size: 1.8rem;
-            }
-            .hackaton-title {
-                font-size: 1.4rem;
-                letter-spacing: 1px;
-            }
-            .powered-by {
-                font-size: 0.8rem;
-            }
-            .ignite-sticker-flame img {
-                width: 120px;
-                height: 120px;
-            }
-            .ignite-sticker-rocket img {
-                width: 120px;
-                height: 120px;
-            }
-        }
-    </style>
-</head>
-<body>
-    <!-- FSI 3 Hackaton GenAI Full-Width Banner -->
-    <div class="fsi-banner">
-        <div class="container-fluid">
-            <div class="row align-items-center py-3">
-                <div class="col-md-3 text-start">
-                    <h2 class="fsi-title mb-0">FSI 3</h2>
-                </div>
-                <div class="col-md-6 text-center">
-                    <h3 class="hackaton-title mb-0">HACKATON GenAI</h3>
-                </div>
-                <div class="col-md-3 text-end">
-                    <span class="powered-by">Powered by AWS</span>
-                </div>
-            </div>
-        </div>
-    </div>
-
-    <!-- Hero Section -->
-    <div class="hero-section">
-        <div class="container">
-            <div class="row align-items-center">
-                <div class="col-lg-2 text-center mb-3 mb-lg-0">
-                    <!-- Ignite Rocket Sticker with Glow -->
-                    <div class="ignite-sticker-rocket">
-                        <img src="data:image/png;base64,''' + get_base64_image('Class2025IgniteSticker.png') + '''" 
-                             alt="Ignite Rocket Sticker" 
-                             style="width: 150px; height: auto; max-width: 100%;">
-                    </div>
-                </div>
-                <div class="col-lg-8">
-                    <h1 class="display-4 fw-bold mb-3">
-                        <i class="fas fa-trophy me-3"></i>
-                        Ignite Innovative GenAI Training
-                    </h1>
-                    <p class="lead mb-4">Competition Voting System - DynamoDB Version</p>
-                    <div class="d-flex gap-3">
-                        <span class="badge bg-success fs-6">
-                            <i class="fas fa-database me-1"></i>
-                            Persistent Storage
-                        </span>
-                        <span class="badge bg-info fs-6">
-                            <i class="fas fa-sync me-1"></i>
-                            Real-time Updates
-                        </span>
-                        <span class="badge bg-warning text-dark fs-6">
-                            <i class="fas fa-users me-1"></i>
-                            AWS Brazil Oneteam
-                        </span>
-                        <span class="badge bg-primary fs-6">
-                            <i class="fas fa-code me-1"></i>
-                            FSI 3 Hackaton
-                        </span>
-                    </div>
-                </div>
-                <div class="col-lg-2 text-center">
-                    <!-- Ignite Flame Sticker with Glow -->
-                    <div class="ignite-sticker-flame">
-                        <img src="data:image/png;base64,''' + get_base64_image('IgniteSticker.png') + '''" 
-                             alt="Ignite Flame Sticker" 
-                             style="width: 150px; height: auto; max-width: 100%;">
-                    </div>
-                </div>
-            </div>
-        </div>
-    </div>
-
-    <!-- Main Content -->
-    <div class="container mt-4">
-        <!-- Navigation Tabs -->
-        <ul class="nav nav-tabs mb-4" id="mainTabs" role="tablist">
-            <li class="nav-item" role="presentation">
-                <button class="nav-link active" id="voting-tab" data-bs-toggle="tab" data-bs-target="#voting" type="button" role="tab">
-                    <i class="fas fa-vote-yea me-2"></i>Voting
-                </button>
-            </li>
-            <li class="nav-item" role="presentation">
-                <button class="nav-link" id="leaderboard-tab" data-bs-toggle="tab" data-bs-target="#leaderboard" type="button" role="tab">
-                    <i class="fas fa-trophy me-2"></i>Leaderboard
-                </button>
-            </li>
-            <li class="nav-item" role="presentation">
-                <button class="nav-link" id="teams-tab" data-bs-toggle="tab" data-bs-target="#teams" type="button" role="tab">
-                    <i class="fas fa-users me-2"></i>Teams
-                </button>
-            </li>
-            <li class="nav-item" role="presentation">
-                <button class="nav-link" id="judges-tab" data-bs-toggle="tab" data-bs-target="#judges" type="button" role="tab">
-                    <i class="fas fa-user-tie me-2"></i>Judges
-                </button>
-            </li>
-            <li class="nav-item" role="presentation">
-                <button class="nav-link" id="documentation-tab" data-bs-toggle="tab" data-bs-target="#documentation" type="button" role="tab">
-                    <i class="fas fa-book me-2"></i>Documentation
-                </button>
-            </li>
-            <li class="nav-item" role="presentation">
-                <button class="nav-link" id="admin-tab" data-bs-toggle="tab" data-bs-target="#admin" type="button" role="tab">
-                    <i class="fas fa-cog me-2"></i>Admin
-                </button>
-            </li>
-        </ul>
-
-        <!-- Tab Content -->
-        <div class="tab-content" id="mainTabContent">
-            <!-- Voting Tab -->
-            <div class="tab-pane fade show active" id="voting" role="tabpanel">
-                <div class="row">
-                    <div class="col-lg-8">
-                        <div class="card">
-                            <div class="card-header bg-primary text-white">
-                                <h5 class="mb-0">
-                                    <i class="fas fa-vote-yea me-2"></i>
-                                    Cast Your Vote
-                                </h5>
-                            </div>
-                            <div class="card-body">
-                                <div id="voting-interface">
-                                    <div class="text-center">
-                                        <div class="spinner-border text-primary" role="status">
-                                            <span class="visually-hidden">Loading...</span>
-                                        </div>
-                                        <p class="mt-2">Loading voting interface...</p>
-                                    </div>
-                                </div>
-                            </div>
-                        </div>
-                    </div>
-                    <div class="col-lg-4">
-                        <div class="card">
-                            <div class="card-header">
-                                <h6 class="mb-0">
-                                    <i class="fas fa-info-circle me-2"></i>
-                                    Voting Instructions
-                                </h6>
-                            </div>
-                            <div class="card-body">
-                                <ol class="small">
-                                    <li>Select a judge from the dropdown</li>
-                                    <li>Choose a team to evaluate</li>
-                                    <li>Vote Yes/No for each criterion</li>
-                                    <li>Add optional comments</li>
-                                    <li>Submit your votes</li>
-                                </ol>
-                                <div class="alert alert-info small">
-                                    <i class="fas fa-lightbulb me-1"></i>
-                                    <strong>Tip:</strong> Each criterion has a different weight in the final scoring.
-                                </div>
-                            </div>
-                        </div>
-                    </div>
-                </div>
-            </div>
-
-            <!-- Leaderboard Tab -->
-            <div class="tab-pane fade" id="leaderboard" role="tabpanel">
-                <div class="card">
-                    <div class="card-header bg-success text-white d-flex justify-content-between align-items-center">
-                        <h5 class="mb-0">
-                            <i class="fas fa-trophy me-2"></i>
-                            Competition Leaderboard
-                        </h5>
-                        <button class="btn btn-light btn-sm" onclick="loadLeaderboard()">
-                            <i class="fas fa-sync me-1"></i>Refresh
-                        </button>
-                    </div>
-                    <div class="card-body">
-                        <div id="leaderboard-content">
-                            <div class="text-center">
-                                <div class="spinner-border text-success" role="status">
-                                    <span class="visually-hidden">Loading...</span>
-                                </div>
-                                <p class="mt-2">Loading leaderboard...</p>
-                            </div>
-                        </div>
-                    </div>
-                </div>
-            </div>
+        'headers': headers,
+        'body': MAIN_PAGE_HTML
+    }
 
-            <!-- Teams Tab -->
-            <div class="tab-pane fade" id="teams" role="tabpanel">
-                <div class="card">
-                    <div class="card-header bg-info text-white d-flex justify-content-between align-items-center">
-                        <h5 class="mb-0">
-                            <i class="fas fa-users me-2"></i>
-                            Competition Teams
-                        </h5>
-                        <button class="btn btn-light btn-sm" onclick="loadTeams()">
-                            <i class="fas fa-sync me-1"></i>Refresh
-                        </button>
-                    </div>
-                    <div class="card-body">
-                        <div id="teams-content">
-                            <div class="text-center">
-                                <div class="spinner-border text-info" role="status">
-                                    <span class="visually-hidden">Loading...</span>
-                                </div>
-                                <p class="mt-2">Loading teams...</p>
-                            </div>
-                        </div>
-                    </div>
-                </div>
-            </div>
+@lru_cache(maxsize=16)
+def static_file_etag(filename):
+    """Content hash of a bundled file, used as its ETag and cache-busting version"""
+    return hashlib.blake2b(get_base64_file(filename).encode('ascii'), digest_size=8).hexdigest()
 
-            <!-- Judges Tab -->
-            <div class="tab-pane fade" id="judges" role="tabpanel">
-                <div class="card">
-                    <div class="card-header bg-warning text-dark d-flex justify-content-between align-items-center">
-                        <h5 class="mb-0">
-                            <i class="fas fa-user-tie me-2"></i>
-                            Competition Judges
-                        </h5>
-                        <button class="btn btn-dark btn-sm" onclick="loadJudges()">
-                            <i class="fas fa-sync me-1"></i>Refresh
-                        </button>
-                    </div>
-                    <div class="card-body">
-                        <div id="judges-content">
-                            <div class="text-center">
-                                <div class="spinner-border text-warning" role="status">
-                                    <span class="visually-hidden">Loading...</span>
-                                </div>
-                                <p class="mt-2">Loading judges...</p>
-                            </div>
-                        </div>
-                    </div>
-                </div>
-            </div>
-            <!-- Documentation Tab -->
-            <div class="tab-pane fade" id="documentation" role="tabpanel">
-                <div class="card">
-                    <div class="card-header bg-dark text-white">
-                        <h5 class="mb-0">
-                            <i class="fas fa-book me-2"></i>
-                            Competition Documentation
-                        </h5>
-                    </div>
-                    <div class="card-body documentation">
-                        <h4>Ignite Innovative GenAI Training - Voting Structure</h4>
-                        
-                        <h5 class="mt-4">Introduction</h5>
-                        <p>This competition aims to evaluate teams' ability to leverage AWS GenAI services in solving real customer problems. Teams will be judged on their understanding of customer needs, solution design, and presentation skills.</p>
-                        
-                        <h5 class="mt-4">Competition Objectives</h5>
-                        <p>Teams must demonstrate their ability to:</p>
-                        <ul>
-                            <li>Understand customer problems deeply</li>
-                            <li>Define success criteria collaboratively with customers</li>
-                            <li>Present relevant demos that validate solutions</li>
-                            <li>Correlate demos with actual PoC services</li>
-                            <li>Leverage AWS GenAI services effectively</li>
-                            <li>Collaborate effectively as a team</li>
-                            <li>Take notes to address unanswered questions</li>
-                        </ul>
-                        
-                        <h5 class="mt-4">Scoring Criteria (Yes/No Questions)</h5>
-                        
-                        <div class="row">
-                            <div class="col-md-6">
-                                <div class="card mb-3">
-                                    <div class="card-header bg-primary text-white">
-                                        <strong>1. Problem Understanding (Weight: 15%)</strong>
-                                    </div>
-                                    <div class="card-body">
-                                        <p><strong>Question:</strong> Did the team demonstrate deep understanding of the customer's problem?</p>
-                                        <p><strong>Yes:</strong> Team clearly articulated the problem, its impact, and root causes</p>
-                                        <p><strong>No:</strong> Problem understanding was superficial or unclear</p>
-                                    </div>
-                                </div>
-                                
-                                <div class="card mb-3">
-                                    <div class="card-header bg-primary text-white">
-                                        <strong>2. Success Criteria Definition (Weight: 15%)</strong>
-                                    </div>
-                                    <div class="card-body">
-                                        <p><strong>Question:</strong> Did the team determine success criteria collaboratively with the customer?</p>
-                                        <p><strong>Yes:</strong> Clear evidence of customer collaboration in defining measurable outcomes</p>
-                                        <p><strong>No:</strong> Success criteria were defined unilaterally or are vague</p>
-                                    </div>
-                                </div>
-                                
-                                <div class="card mb-3">
-                                    <div class="card-header bg-primary text-white">
-                                        <strong>3. Demo Relevance (Weight: 15%)</strong>
-                                    </div>
-                                    <div class="card-body">
-                                        <p><strong>Question:</strong> Did the team present a demo that directly addresses the customer problem?</p>
-                                        <p><strong>Yes:</strong> Demo clearly validates the proposed solution approach</p>
-                                        <p><strong>No:</strong> Demo was generic or didn't address the specific problem</p>
-                                    </div>
-                                </div>
-                                
-                                <div class="card mb-3">
-                                    <div class="card-header bg-primary text-white">
-                                        <strong>4. Service Correlation (Weight: 15%)</strong>
-                                    </div>
-                                    <div class="card-body">
-                                        <p><strong>Question:</strong> Did the team effectively correlate the demo with AWS services for the PoC?</p>
-                                        <p><strong>Yes:</strong> Clear mapping between demo components and proposed PoC architecture</p>
-                                        <p><strong>No:</strong> Weak or missing connection between demo and PoC services</p>
-                                    </div>
-                                </div>
-                            </div>
-                            
-                            <div class="col-md-6">
-                                <div class="card mb-3">
-                                    <div class="card-header bg-primary text-white">
-                                        <strong>5. GenAI Services Usage (Weight: 15%)</strong>
-                                    </div>
-                                    <div class="card-body">
-                                        <p><strong>Question:</strong> Did the team leverage AWS GenAI services appropriately?</p>
-                                        <p><strong>Yes:</strong> Meaningful integration of GenAI services that add value to the solution</p>
-                                        <p><strong>No:</strong> No GenAI services used or inappropriate/forced usage</p>
-                                    </div>
-                                </div>
-                                
-                                <div class="card mb-3">
-                                    <div class="card-header bg-primary text-white">
-                                        <strong>6. Team Collaboration (Weight: 10%)</strong>
-                                    </div>
-                                    <div class="card-body">
-                                        <p><strong>Question:</strong> Did the team demonstrate effective collaboration during the presentation?</p>
-                                        <p><strong>Yes:</strong> All team members actively contributed and demonstrated complementary roles</p>
-                                        <p><strong>No:</strong> Limited participation or uneven contribution from team members</p>
-                                    </div>
-                                </div>
-                                
-                                <div class="card mb-3">
-                                    <div class="card-header bg-primary text-white">
-                                        <strong>7. Notes of Unanswered Questions (Weight: 15%)</strong>
-                                    </div>
-                                    <div class="card-body">
-                                        <p><strong>Question:</strong> Did the team take notes of the unanswered questions to address later?</p>
-                                        <p><strong>Yes:</strong> They have taken notes and did not assume answers based on their assumptions</p>
-                                        <p><strong>No:</strong> Did not take notes of unanswered questions or answered without knowledge</p>
-                                    </div>
-                                </div>
-                            </div>
-                        </div>
-                        
-                        <h5 class="mt-4">Scoring Methodology</h5>
-                        
-                        <div class="alert alert-info">
-                            <h6>Judge Scoring:</h6>
-                            <ul class="mb-0">
-                                <li>Each judge answers Yes/No for all 7 criteria</li>
-                                <li>Yes = 1 point, No = 0 points</li>
-                                <li>Maximum score per judge: 7 points</li>
-                            </ul>
-                        </div>
-                        
-                        <div class="alert alert-success">
-                            <h6>Final Team Score Calculation:</h6>
-                            <ul class="mb-0">
-                                <li>Calculate each judge's percentage: (Yes votes / 7 criteria) × 100</li>
-                                <li>Final team score = Average of all judge percentages</li>
-                                <li>Example: Judge A: 71.4%, Judge B: 85.7% → Final: 78.6%</li>
-                            </ul>
-                        </div>
-                        
-                        <h6>Example Scoring</h6>
-                        <table class="table table-bordered">
-                            <thead>
-                                <tr>
-                                    <th>Judge</th>
-                                    <th>Yes Votes</th>
-                                    <th>Percentage</th>
-                                </tr>
-                            </thead>
-                            <tbody>
-                                <tr>
-                                    <td>Judge 1</td>
-                                    <td>6/7 Yes</td>
-                                    <td>85.7%</td>
-                                </tr>
-                                <tr>
-                                    <td>Judge 2</td>
-                                    <td>5/7 Yes</td>
-                                    <td>71.4%</td>
-                                </tr>
-                                <tr>
-                                    <td>Judge 3</td>
-                                    <td>7/7 Yes</td>
-                                    <td>100.0%</td>
-                                </tr>
-                                <tr class="table-success">
-                                    <td><strong>Final Score</strong></td>
-                                    <td><strong>18/21 Total</strong></td>
-                                    <td><strong>85.7%</strong></td>
-                                </tr>
-                            </tbody>
-                        </table>
-                        
-                        <h5 class="mt-4">Deliverables Required from Teams</h5>
-                        <ul>
-                            <li>Customer problem statement (max 200 words)</li>
-                            <li>Success criteria definition process documentation</li>
-                            <li>Demo recording or live presentation (15-20 minutes)</li>
-                            <li>AWS services architecture diagram for PoC</li>
-                            <li>GenAI services integration plan</li>
-                        </ul>
-                    </div>
-                </div>
-            </div>
+@lru_cache(maxsize=16)
+def get_gzip_base64_file(filename):
+    """Gzip-encoded copy of a bundled text file, compressed once per container"""
+    return base64.b64encode(gzip.compress(base64.b64decode(get_base64_file(filename)), compresslevel=9)).decode('ascii')
 
-            <!-- Admin Tab -->
-            <div class="tab-pane fade" id="admin" role="tabpanel">
-                <div class="row">
-                    <div class="col-md-6">
-                        <div class="card">
-                            <div class="card-header bg-primary text-white">
-                                <h6 class="mb-0">
-                                    <i class="fas fa-plus me-2"></i>Add New Team
-                                </h6>
-                            </div>
-                            <div class="card-body">
-                                <form id="add-team-form">
-                                    <div class="mb-3">
-                                        <label for="team-name" class="form-label">Team Name *</label>
-                                        <input type="text" class="form-control" id="team-name" required>
-                                    </div>
-                                    <div class="mb-3">
-                                        <label for="team-problem-statement" class="form-label">Customer Problem Statement</label>
-                                        <textarea class="form-control" id="team-problem-statement" rows="3" placeholder="Describe the customer problem this team is addressing..."></textarea>
-                                    </div>
-                                    <div class="mb-3">
-                                        <label for="team-success-criteria" class="form-label">Success Criteria</label>
-                                        <textarea class="form-control" id="team-success-criteria" rows="3" placeholder="Define what success looks like for this solution..."></textarea>
-                                    </div>
-                                    <button type="submit" class="btn btn-primary">
-                                        <i class="fas fa-plus me-1"></i>Add Team
-                                    </button>
-                                </form>
-                            </div>
-                        </div>
-
-                        <div class="card">
-                            <div class="card-header bg-info text-white">
-                                <h6 class="mb-0">
-                                    <i class="fas fa-user-plus me-2"></i>Add New Judge
-                                </h6>
-                            </div>
-                            <div class="card-body">
-                                <form id="add-judge-form">
-                                    <div class="mb-3">
-                                        <label for="judge-name" class="form-label">Judge Name *</label>
-                                        <input type="text" class="form-control" id="judge-name" required>
-                                    </div>
-                                    <div class="mb-3">
-                                        <label for="judge-email" class="form-label">Email *</label>
-                                        <input type="email" class="form-control" id="judge-email" required>
-                                    </div>
-                                    <div class="mb-3">
-                                        <label for="judge-role" class="form-label">Role</label>
-                                        <input type="text" class="form-control" id="judge-role">
-                                    </div>
-                                    <button type="submit" class="btn btn-info">
-                                        <i class="fas fa-user-plus me-1"></i>Add Judge
-                                    </button>
-                                </form>
-                            </div>
-                        </div>
-                    </div>
-
-                    <div class="col-md-6">
-                        <div class="card">
-                            <div class="card-header bg-secondary text-white">
-                                <h6 class="mb-0">
-                                    <i class="fas fa-cogs me-2"></i>System Management
-                                </h6>
-                            </div>
-                            <div class="card-body">
-                                <div class="d-grid gap-2">
-                                    <button type="button" class="btn btn-info" onclick="manualRefresh()">
-                                        <i class="fas fa-sync me-1"></i>Refresh All Data
-                                    </button>
-                                    <button type="button" class="btn btn-warning" onclick="clearAllSampleData()">
-                                        <i class="fas fa-trash me-1"></i>Clear All Data
-                                    </button>
-                                </div>
-                                <hr>
-                                <small class="text-muted">
-                                    <i class="fas fa-info-circle me-1"></i>
-                                    Use "Refresh All Data" if the interface is not updating properly.
-                                    Use "Clear All Data" to completely reset the system.
-                                </small>
-                            </div>
-                        </div>
-
-                        <div class="card">
-                            <div class="card-header bg-dark text-white">
-                                <h6 class="mb-0">
-                                    <i class="fas fa-chart-bar me-2"></i>System Status
-                                </h6>
-                            </div>
-                            <div class="card-body">
-                                <div id="system-status">
-                                    <div class="text-center">
-                                        <div class="spinner-border text-dark" role="status">
-                                            <span class="visually-hidden">Loading...</span>
-                                        </div>
-                                        <p class="mt-2">Loading status...</p>
-                                    </div>
-                                </div>
-                            </div>
-                        </div>
-                    </div>
-                </div>
-                
-                <!-- Criteria Management Row -->
-                <div class="row mt-4">
-                    <div class="col-12">
-                        <div class="card">
-                            <div class="card-header bg-warning text-dark">
-                                <h6 class="mb-0">
-                                    <i class="fas fa-list-check me-2"></i>Criteria Management
-                                </h6>
-                            </div>
-                            <div class="card-body">
-                                <div class="row">
-                                    <div class="col-md-6">
-                                        <h6>Add New Criteria</h6>
-                                        <form id="add-criteria-form">
-                                            <div class="mb-3">
-                                                <label for="criteria-name" class="form-label">Criteria Name *</label>
-                                                <input type="text" class="form-control" id="criteria-name" required>
-                                            </div>
-                                            <div class="mb-3">
-                                                <label for="criteria-weight" class="form-label">Weight (%) *</label>
-                                                <input type="number" class="form-control" id="criteria-weight" min="1" max="100" required>
-                                            </div>
-                                            <div class="mb-3">
-                                                <label for="criteria-description" class="form-label">Description</label>
-                                                <textarea class="form-control" id="criteria-description" rows="2" placeholder="Question or description for this criteria"></textarea>
-                                            </div>
-                                            <button type="submit" class="btn btn-warning">
-                                                <i class="fas fa-plus me-1"></i>Add Criteria
-                                            </button>
-                                        </form>
-                                    </div>
-                                    <div class="col-md-6">
-                                        <h6>Current Criteria</h6>
-                                        <div id="criteria-list">
-                                            <div class="text-center">
-                                                <div class="spinner-border text-warning" role="status">
-                                                    <span class="visually-hidden">Loading...</span>
-                                                </div>
-                                                <p class="mt-2">Loading criteria...</p>
-                                            </div>
-                                        </div>
-                                        <button class="btn btn-outline-warning btn-sm mt-2" onclick="loadCriteriaList()">
-                                            <i class="fas fa-sync me-1"></i>Refresh Criteria
-                                        </button>
-                                    </div>
-                                </div>
-                            </div>
-                        </div>
-                    </div>
-                </div>
-            </div>
-        </div>
-    </div>
+def static_file_url(filename):
+    return f"/Prod{STATIC_PREFIX}{filename}?v={static_file_etag(filename)}"
 
-    <!-- Bootstrap JS -->
-    <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/js/bootstrap.bundle.min.js"></script>
+def serve_static_file(event, filename):
+    """Serve a bundled file as binary, revalidated with its content-hash ETag; text files are gzipped when accepted"""
+    body = get_base64_file(filename)
+    if not body:
+        return {'statusCode': 404, 'headers': JSON_HEADERS, 'body': to_json({'error': f'File not found: {filename}'})}
     
-    <script>
-        // Global variables
-        let currentData = { teams: [], judges: [], criteria: [] };
-        
-        // API helper function with correct path
-        async function apiCall(endpoint, options = {}) {
-            const url = endpoint.startsWith('/') ? `/Prod/api${endpoint}` : `/Prod/api/${endpoint}`;
-            const response = await fetch(url, {
-                headers: {
-                    'Content-Type': 'application/json',
-                    ...options.headers
-                },
-                ...options
-            });
-            
-            const responseData = await response.json();
-            
-            if (!response.ok) {
-                // For 409 (Conflict) status, include the response data in the error
-                if (response.status === 409) {
-                    const error = new Error('duplicate_votes');
-                    error.response = responseData;
-                    throw error;
-                } else {
-                    throw new Error(responseData.error || `HTTP error! status: ${response.status}`);
-                }
-            }
-            
-            return responseData;
-        }
-        
-        // Load initial data
-        async function loadInitialData() {
-            try {
-                console.log('Loading initial data...');
-                const [teams, judges, criteria] = await Promise.all([
-                    apiCall('/teams'),
-                    apiCall('/judges'),
-                    apiCall('/criteria')
-                ]);
-                
-                console.log('Initial data loaded:', { teams: teams.length, judges: judges.length, criteria: criteria.length });
-                currentData = { teams, judges, criteria };
-                
-                // Update all interfaces
-                loadVotingInterface();
-                updateSystemStatus();
-                
-                // Refresh visible tabs
-                const activeTab = document.querySelector('.tab-pane.active, .tab-pane.show');
-                if (activeTab) {
-                    const tabId = activeTab.id;
-                    if (tabId === 'teams') {
-                        loadTeams();
-                    } else if (tabId === 'judges') {
-                        loadJudges();
-                    } else if (tabId === 'leaderboard') {
-                        loadLeaderboard();
-                    }
-                }
-                
-            } catch (error) {
-                console.error('Error loading initial data:', error);
-                showError('Failed to load initial data: ' + error.message);
-            }
-        }
-        
-        // Load voting interface
-        function loadVotingInterface() {
-            const container = document.getElementById('voting-interface');
-            
-            if (currentData.judges.length === 0 || currentData.teams.length === 0) {
-                container.innerHTML = `
-                    <div class="alert alert-warning">
-                        <i class="fas fa-exclamation-triangle me-2"></i>
-                        <strong>Setup Required:</strong> Please add teams and judges in the Admin tab before voting can begin.
-                    </div>
-                `;
-                return;
-            }
-            
-            container.innerHTML = `
-                <form id="voting-form">
-                    <div class="row">
-                        <div class="col-md-6">
-                            <div class="mb-3">
-                                <label for="judge-select" class="form-label">Select Judge *</label>
-                                <select class="form-select" id="judge-select" required>
-                                    <option value="">Choose a judge...</option>
-                                    ${currentData.judges.map(judge => 
-                                        `<option value="${judge.id}">${judge.name} (${judge.email})</option>`
-                                    ).join('')}
-                                </select>
-                            </div>
-                        </div>
-                        <div class="col-md-6">
-                            <div class="mb-3">
-                                <label for="team-select" class="form-label">Select Team *</label>
-                                <select class="form-select" id="team-select" required>
-                                    <option value="">Choose a team...</option>
-                                    ${currentData.teams.map(team => 
-                                        `<option value="${team.id}">${team.name}</option>`
-                                    ).join('')}
-                                </select>
-                            </div>
-                        </div>
-                    </div>
-                    
-                    <!-- Team Details Section -->
-                    <div id="team-details" class="mb-4" style="display: none;">
-                        <div class="card border-info">
-                            <div class="card-header bg-info text-white">
-                                <h6 class="mb-0">
-                                    <i class="fas fa-info-circle me-2"></i>
-                                    Team Details
-                                </h6>
-                            </div>
-                            <div class="card-body">
-                                <div id="team-details-content"></div>
-                            </div>
-                        </div>
-                    </div>
-                    
-                    <div class="mb-4">
-                        <h6>Evaluation Criteria:</h6>
-                        <div id="criteria-voting">
-                            ${currentData.criteria.map(criteria => `
-                                <div class="card mb-2">
-                                    <div class="card-body">
-                                        <div class="row align-items-center">
-                                            <div class="col-md-6">
-                                                <strong>${criteria.name}</strong>
-                                                <small class="text-muted d-block">Weight: ${criteria.weight}%</small>
-                                            </div>
-                                            <div class="col-md-4">
-                                                <div class="btn-group" role="group">
-                                                    <input type="radio" class="btn-check" name="criteria_${criteria.id}" id="yes_${criteria.id}" value="1">
-                                                    <label class="btn btn-outline-success" for="yes_${criteria.id}">
-                                                        <i class="fas fa-check me-1"></i>Yes
-                                                    </label>
-                                                    
-                                                    <input type="radio" class="btn-check" name="criteria_${criteria.id}" id="no_${criteria.id}" value="0">
-                                                    <label class="btn btn-outline-danger" for="no_${criteria.id}">
-                                                        <i class="fas fa-times me-1"></i>No
-                                                    </label>
-                                                </div>
-                                            </div>
-                                            <div class="col-md-2">
-                                                <textarea class="form-control form-control-sm auto-expand-textarea" 
-                                                         placeholder="Comments" 
-                                                         id="comments_${criteria.id}"
-                                                         rows="1"
-                                                         style="resize: none; overflow: hidden; min-height: 31px;"></textarea>
-                                            </div>
-                                        </div>
-                                    </div>
-                                </div>
-                            `).join('')}
-                        </div>
-                    </div>
-                    
-                    <div class="d-grid">
-                        <button type="submit" class="btn btn-primary btn-lg">
-                            <i class="fas fa-vote-yea me-2"></i>Submit Votes
-                        </button>
-                    </div>
-                </form>
-            `;
-            
-            // Add team selection change handler
-            document.getElementById('team-select').addEventListener('change', function() {
-                const teamId = this.value;
-                const teamDetailsDiv = document.getElementById('team-details');
-                const teamDetailsContent = document.getElementById('team-details-content');
-                
-                if (teamId) {
-                    const selectedTeam = currentData.teams.find(team => team.id === teamId);
-                    if (selectedTeam) {
-                        teamDetailsContent.innerHTML = `
-                            <h5 class="text-primary mb-3">
-                                <i class="fas fa-users me-2"></i>
-                                ${selectedTeam.name}
-                            </h5>
-                            ${selectedTeam.problem_statement ? `
-                                <div class="mb-3">
-                                    <strong class="text-info">
-                                        <i class="fas fa-question-circle me-1"></i>
-                                        Customer Problem Statement:
-                                    </strong>
-                                    <p class="mt-1">${selectedTeam.problem_statement}</p>
-                                </div>
-                            ` : ''}
-                            ${selectedTeam.success_criteria ? `
-                                <div class="mb-3">
-                                    <strong class="text-success">
-                                        <i class="fas fa-bullseye me-1"></i>
-                                        Success Criteria:
-                                    </strong>
-                                    <p class="mt-1">${selectedTeam.success_criteria}</p>
-                                </div>
-                            ` : ''}
-                        `;
-                        teamDetailsDiv.style.display = 'block';
-                    }
-                } else {
-                    teamDetailsDiv.style.display = 'none';
-                }
-            });
-            
-            // Add form submission handler
-            document.getElementById('voting-form').addEventListener('submit', handleVoteSubmission);
-            
-            // Add auto-expanding functionality to comment textareas
-            const commentTextareas = document.querySelectorAll('.auto-expand-textarea');
-            commentTextareas.forEach(textarea => {
-                // Auto-expand function
-                function autoExpand() {
-                    textarea.style.height = 'auto';
-                    textarea.style.height = Math.max(31, textarea.scrollHeight) + 'px';
-                }
-                
-                // Add event listeners
-                textarea.addEventListener('input', autoExpand);
-                textarea.addEventListener('focus', autoExpand);
-                
-                // Set initial height
-                autoExpand();
-            });
-        }
-        
-        // Handle vote submission
-        async function handleVoteSubmission(event, overwriteExisting = false) {
-            event.preventDefault();
-            
-            const judgeId = document.getElementById('judge-select').value;
-            const teamId = document.getElementById('team-select').value;
-            
-            if (!judgeId || !teamId) {
-                alert('Please select both a judge and a team.');
-                return;
-            }
-            
-            const submitButton = event.target.querySelector('button[type="submit"]');
-            const originalText = submitButton.innerHTML;
-            submitButton.innerHTML = '<i class="fas fa-spinner fa-spin me-2"></i>Submitting...';
-            submitButton.disabled = true;
-            
-            try {
-                const votes = [];
-                
-                for (const criteria of currentData.criteria) {
-                    const selectedValue = document.querySelector(`input[name="criteria_${criteria.id}"]:checked`);
-                    if (selectedValue) {
-                        const comments = document.getElementById(`comments_${criteria.id}`).value;
-                        
-                        votes.push({
-                            criteria_id: criteria.id,
-                            score: parseInt(selectedValue.value),
-                            comments: comments
-                        });
-                    }
-                }
-                
-                if (votes.length === 0) {
-                    alert('Please vote on at least one criterion.');
-                    return;
-                }
-                
-                // Use the new batch submission endpoint with email notification
-                const response = await apiCall('/submit-votes', {
-                    method: 'POST',
-                    body: JSON.stringify({
-                        judge_id: judgeId,
-                        team_id: teamId,
-                        votes: votes,
-                        overwrite_existing: overwriteExisting
-                    })
-                });
-                
-                // Show success message with email confirmation
-                const emailStatus = response.email_sent ? 
-                    `\\n\\n📧 Confirmation email sent to: ${response.judge_email}` : 
-                    '\\n\\n⚠️ Note: Email confirmation could not be sent.';
-                
-                let successMessage = `✅ Successfully submitted ${response.votes_count} votes!`;
-                
-                // Add overwrite information if applicable
-                if (response.action === 'overwrite') {
-                    successMessage += `\\n\\n🔄 Updated previous votes (${response.overwritten_votes} votes replaced)`;
-                }
-                
-                alert(successMessage + emailStatus);
-                
-                // Reset form
-                event.target.reset();
-                
-                // Reset textarea heights
-                const commentTextareas = document.querySelectorAll('.auto-expand-textarea');
-                commentTextareas.forEach(textarea => {
-                    textarea.style.height = '31px';
-                });
-                
-                // Hide team details section
-                document.getElementById('team-details').style.display = 'none';
-                
-                // Refresh leaderboard if visible
-                if (document.getElementById('leaderboard').classList.contains('show')) {
-                    loadLeaderboard();
-                }
-                
-            } catch (error) {
-                console.error('Error submitting votes:', error);
-                
-                // Handle duplicate vote error specifically
-                if (error.message.includes('duplicate_votes') || (error.response && error.response.error === 'duplicate_votes')) {
-                    const errorData = error.response || JSON.parse(error.message);
-                    const existingDate = new Date(errorData.existing_votes_date).toLocaleString();
-                    
-                    const confirmMessage = `⚠️ DUPLICATE VOTE DETECTED\\n\\n` +
-                        `You have already voted for this team on ${existingDate}.\\n` +
-                        `Existing votes: ${errorData.existing_votes_count}\\n\\n` +
-                        `Do you want to OVERWRITE your previous votes?\\n\\n` +
-                        `⚠️ This action cannot be undone!`;
-                    
-                    if (confirm(confirmMessage)) {
-                        // Retry with overwrite flag
-                        await handleVoteSubmission(event, true);
-                        return;
-                    } else {
-                        alert('Vote submission cancelled. Your previous votes remain unchanged.');
-                    }
-                } else {
-                    alert('Failed to submit votes: ' + error.message);
-                }
-            } finally {
-                submitButton.innerHTML = originalText;
-                submitButton.disabled = false;
-            }
-        }
-        
-        // Load teams
-        async function loadTeams() {
-            const container = document.getElementById('teams-content');
-            
-            try {
-                const teams = await apiCall('/teams');
-                
-                if (teams.length === 0) {
-                    container.innerHTML = `
-                        <div class="alert alert-info">
-                            <i class="fas fa-info-circle me-2"></i>
-                            No teams found. Add teams in the Admin tab.
-                        </div>
-                    `;
-                    return;
-                }
-                
-                container.innerHTML = `
-                    <div class="row">
-                        ${teams.map(team => `
-                            <div class="col-md-6 mb-3">
-                                <div class="card">
-                                    <div class="card-body">
-                                        <h5 class="card-title">
-                                            <i class="fas fa-users me-2 text-primary"></i>
-                                            ${team.name}
-                                        </h5>
-                                        ${team.problem_statement ? `
-                                            <div class="mb-2">
-                                                <strong class="text-info">
-                                                    <i class="fas fa-question-circle me-1"></i>
-                                                    Customer Problem Statement:
-                                                </strong>
-                                                <p class="card-text mt-1">${team.problem_statement}</p>
-                                            </div>
-                                        ` : ''}
-                                        ${team.success_criteria ? `
-                                            <div class="mb-2">
-                                                <strong class="text-success">
-                                                    <i class="fas fa-bullseye me-1"></i>
-                                                    Success Criteria:
-                                                </strong>
-                                                <p class="card-text mt-1">${team.success_criteria}</p>
-                                            </div>
-                                        ` : ''}
-                                        <small class="text-muted">
-                                            <i class="fas fa-trophy me-1"></i>
-                                            Competition: ${team.competition_name || 'Ignite Innovative GenAI Training'}
-                                        </small>
-                                    </div>
-                                </div>
-                            </div>
-                        `).join('')}
-                    </div>
-                `;
-                
-            } catch (error) {
-                console.error('Error loading teams:', error);
-                container.innerHTML = `
-                    <div class="alert alert-danger">
-                        <i class="fas fa-exclamation-triangle me-2"></i>
-                        Failed to load teams: ${error.message}
-                    </div>
-                `;
-            }
-        }
-        
-        // Load judges
-        async function loadJudges() {
-            const container = document.getElementById('judges-content');
-            
-            try {
-                const judges = await apiCall('/judges');
-                
-                if (judges.length === 0) {
-                    container.innerHTML = `
-                        <div class="alert alert-info">
-                            <i class="fas fa-info-circle me-2"></i>
-                            No judges found. Add judges in the Admin tab.
-                        </div>
-                    `;
-                    return;
-                }
-                
-                container.innerHTML = `
-                    <div class="row">
-                        ${judges.map(judge => `
-                            <div class="col-md-6 mb-3">
-                                <div class="card">
-                                    <div class="card-body">
-                                        <h5 class="card-title">
-                                            <i class="fas fa-user-tie me-2 text-warning"></i>
-                                            ${judge.name}
-                                        </h5>
-                                        <p class="card-text">
-                                            <i class="fas fa-envelope me-1"></i>
-                                            ${judge.email}
-                                        </p>
-                                        <small class="text-muted">
-                                            <i class="fas fa-briefcase me-1"></i>
-                                            ${judge.role || 'Judge'}
-                                        </small>
-                                    </div>
-                                </div>
-                            </div>
-                        `).join('')}
-                    </div>
-                `;
-                
-            } catch (error) {
-                console.error('Error loading judges:', error);
-                container.innerHTML = `
-                    <div class="alert alert-danger">
-                        <i class="fas fa-exclamation-triangle me-2"></i>
-                        Failed to load judges: ${error.message}
-                    </div>
-                `;
-            }
-        }
-        
-        // Load leaderboard
-        async function loadLeaderboard() {
-            const container = document.getElementById('leaderboard-content');
-            
-            try {
-                const leaderboard = await apiCall('/leaderboard');
-                
-                if (leaderboard.length === 0) {
-                    container.innerHTML = `
-                        <div class="alert alert-info">
-                            <i class="fas fa-info-circle me-2"></i>
-                            No votes submitted yet. Start voting to see the leaderboard!
-                        </div>
-                    `;
-                    return;
-                }
-                
-                container.innerHTML = `
-                    <div class="row">
-                        ${leaderboard.map((team, index) => `
-                            <div class="col-12 mb-3">
-                                <div class="card leaderboard-item ${index === 0 ? 'border-warning' : ''}">
-                                    <div class="card-body">
-                                        <div class="row align-items-center">
-                                            <div class="col-md-1 text-center">
-                                                <span class="badge ${index === 0 ? 'bg-warning text-dark' : index === 1 ? 'bg-secondary' : index === 2 ? 'bg-info' : 'bg-light text-dark'} score-badge">
-                                                    ${index === 0 ? '<i class="fas fa-crown"></i>' : '#' + (index + 1)}
-                                                </span>
-                                            </div>
-                                            <div class="col-md-4">
-                                                <h5 class="mb-1">${team.team_name}</h5>
-                                                <small class="text-muted">${team.problem_statement || 'No problem statement provided'}</small>
-                                            </div>
-                                            <div class="col-md-2 text-center">
-                                                <div class="badge bg-success score-badge">
-                                                    ${team.total_score.toFixed(1)}
-                                                </div>
-                                                <small class="d-block text-muted">Total Score</small>
-                                            </div>
-                                            <div class="col-md-2 text-center">
-                                                <div class="badge bg-info score-badge">
-                                                    ${team.vote_count}
-                                                </div>
-                                                <small class="d-block text-muted">Votes</small>
-                                            </div>
-                                            <div class="col-md-2 text-center">
-                                                <div class="badge bg-primary score-badge">
-                                                    ${team.judge_count}
-                                                </div>
-                                                <small class="d-block text-muted">Judges</small>
-                                            </div>
-                                            <div class="col-md-1 text-center">
-                                                <div class="badge bg-secondary">
-                                                    ${(team.weighted_percentage).toFixed(1)}%
-                                                </div>
-                                                <small class="d-block text-muted">Score</small>
-                                            </div>
-                                        </div>
-                                    </div>
-                                </div>
-                            </div>
-                        `).join('')}
-                    </div>
-                `;
-                
-            } catch (error) {
-                console.error('Error loading leaderboard:', error);
-                container.innerHTML = `
-                    <div class="alert alert-danger">
-                        <i class="fas fa-exclamation-triangle me-2"></i>
-                        Failed to load leaderboard: ${error.message}
-                    </div>
-                `;
-            }
-        }
-        
-        // Update system status
-        async function updateSystemStatus() {
-            const container = document.getElementById('system-status');
-            
-            try {
-                const debugData = await apiCall('/debug-db');
-                const counts = debugData.counts;
-                
-                container.innerHTML = `
-                    <div class="row text-center">
-                        <div class="col-6">
-                            <div class="badge bg-primary fs-6 mb-1">${counts.teams}</div>
-                            <div class="small">Teams</div>
-                        </div>
-                        <div class="col-6">
-                            <div class="badge bg-info fs-6 mb-1">${counts.judges}</div>
-                            <div class="small">Judges</div>
-                        </div>
-                        <div class="col-6 mt-2">
-                            <div class="badge bg-success fs-6 mb-1">${counts.votes}</div>
-                            <div class="small">Votes</div>
-                        </div>
-                        <div class="col-6 mt-2">
-                            <div class="badge bg-warning text-dark fs-6 mb-1">${counts.criteria}</div>
-                            <div class="small">Criteria</div>
-                        </div>
-                    </div>
-                    <hr>
-                    <div class="text-center">
-                        <span class="badge bg-success">
-                            <i class="fas fa-database me-1"></i>DynamoDB Active
-                        </span>
-                    </div>
-                `;
-                
-            } catch (error) {
-                console.error('Error loading system status:', error);
-                container.innerHTML = `
-                    <div class="alert alert-danger small">
-                        <i class="fas fa-exclamation-triangle me-1"></i>
-                        Status unavailable
-                    </div>
-                `;
-            }
-        }
-        
-        // Add team
-        document.getElementById('add-team-form').addEventListener('submit', async function(event) {
-            event.preventDefault();
-            
-            const name = document.getElementById('team-name').value.trim();
-            const problemStatement = document.getElementById('team-problem-statement').value.trim();
-            const successCriteria = document.getElementById('team-success-criteria').value.trim();
-            
-            if (!name) {
-                alert('Team name is required.');
-                return;
-            }
-            
-            const submitButton = event.target.querySelector('button[type="submit"]');
-            const originalText = submitButton.innerHTML;
-            submitButton.innerHTML = '<i class="fas fa-spinner fa-spin me-1"></i>Adding...';
-            submitButton.disabled = true;
-            
-            try {
-                await apiCall('/teams', {
-                    method: 'POST',
-                    body: JSON.stringify({ 
-                        name, 
-                        problem_statement: problemStatement,
-                        success_criteria: successCriteria 
-                    })
-                });
-                
-                alert('Team added successfully!');
-                event.target.reset();
-                
-                // Refresh data
-                await loadInitialData();
-                
-                // Refresh teams tab if visible
-                if (document.getElementById('teams').classList.contains('show')) {
-                    loadTeams();
-                }
-                
-            } catch (error) {
-                console.error('Error adding team:', error);
-                alert('Failed to add team: ' + error.message);
-            } finally {
-                submitButton.innerHTML = originalText;
-                submitButton.disabled = false;
-            }
-        });
-        
-        // Add judge
-        document.getElementById('add-judge-form').addEventListener('submit', async function(event) {
-            event.preventDefault();
-            
-            const name = document.getElementById('judge-name').value.trim();
-            const email = document.getElementById('judge-email').value.trim();
-            const role = document.getElementById('judge-role').value.trim();
-            
-            if (!name || !email) {
-                alert('Name and email are required.');
-                return;
-            }
-            
-            const submitButton = event.target.querySelector('button[type="submit"]');
-            const originalText = submitButton.innerHTML;
-            submitButton.innerHTML = '<i class="fas fa-spinner fa-spin me-1"></i>Adding...';
-            submitButton.disabled = true;
-            
-            try {
-                await apiCall('/judges', {
-                    method: 'POST',
-                    body: JSON.stringify({ name, email, role })
-                });
-                
-                alert('Judge added successfully!');
-                event.target.reset();
-                
-                // Refresh data
-                await loadInitialData();
-                
-                // Refresh judges tab if visible
-                if (document.getElementById('judges').classList.contains('show')) {
-                    loadJudges();
-                }
-                
-            } catch (error) {
-                console.error('Error adding judge:', error);
-                alert('Failed to add judge: ' + error.message);
-            } finally {
-                submitButton.innerHTML = originalText;
-                submitButton.disabled = false;
-            }
-        });
-        
-        // Add criteria
-        document.getElementById('add-criteria-form').addEventListener('submit', async function(event) {
-            event.preventDefault();
-            
-            const name = document.getElementById('criteria-name').value.trim();
-            const weight = document.getElementById('criteria-weight').value;
-            const description = document.getElementById('criteria-description').value.trim();
-            
-            if (!name || !weight) {
-                alert('Criteria name and weight are required.');
-                return;
-            }
-            
-            const submitButton = event.target.querySelector('button[type="submit"]');
-            const originalText = submitButton.innerHTML;
-            submitButton.innerHTML = '<i class="fas fa-spinner fa-spin me-1"></i>Adding...';
-            submitButton.disabled = true;
-            
-            try {
-                await apiCall('/criteria', {
-                    method: 'POST',
-                    body: JSON.stringify({ name, weight: parseInt(weight), description })
-                });
-                
-                alert('Criteria added successfully!');
-                event.target.reset();
-                
-                // Refresh data
-                await loadInitialData();
-                loadCriteriaList();
-                
-            } catch (error) {
-                console.error('Error adding criteria:', error);
-                alert('Failed to add criteria: ' + error.message);
-            } finally {
-                submitButton.innerHTML = originalText;
-                submitButton.disabled = false;
-            }
-        });
-        
-        // Load criteria list for management
-        async function loadCriteriaList() {
-            const container = document.getElementById('criteria-list');
-            
-            try {
-                const criteria = await apiCall('/criteria');
-                
-                if (criteria.length === 0) {
-                    container.innerHTML = `
-                        <div class="alert alert-info small">
-                            <i class="fas fa-info-circle me-1"></i>
-                            No criteria found.
-                        </div>
-                    `;
-                    return;
-                }
-                
-                const totalWeight = criteria.reduce((sum, c) => sum + parseFloat(c.weight), 0);
-                
-                container.innerHTML = `
-                    <div class="small mb-2">
-                        <strong>Total Weight: ${totalWeight}%</strong>
-                        ${totalWeight !== 100 ? '<span class="text-warning"> (Should be 100%)</span>' : '<span class="text-success"> ✓</span>'}
-                    </div>
-                    ${criteria.map(criteria => `
-                        <div class="card mb-2">
-                            <div class="card-body py-2">
-                                <div class="row align-items-center">
-                                    <div class="col-md-6">
-                                        <strong>${criteria.name}</strong>
-                                        <small class="d-block text-muted">${criteria.description || 'No description'}</small>
-                                    </div>
-                                    <div class="col-md-3">
-                                        <span class="badge bg-primary">${criteria.weight}%</span>
-                                    </div>
-                                    <div class="col-md-3">
-                                        <button class="btn btn-danger btn-sm" onclick="deleteCriteria('${criteria.id}', '${criteria.name}')">
-                                            <i class="fas fa-trash"></i>
-                                        </button>
-                                    </div>
-                                </div>
-                            </div>
-                        </div>
-                    `).join('')}
-                `;
-                
-            } catch (error) {
-                console.error('Error loading criteria list:', error);
-                container.innerHTML = `
-                    <div class="alert alert-danger small">
-                        <i class="fas fa-exclamation-triangle me-1"></i>
-                        Failed to load criteria: ${error.message}
-                    </div>
-                `;
-            }
-        }
-        
-        // Delete criteria
-        async function deleteCriteria(criteriaId, criteriaName) {
-            if (!confirm(`Are you sure you want to delete "${criteriaName}"?\\n\\nThis will also delete all votes for this criteria.`)) {
-                return;
-            }
-            
-            try {
-                const result = await apiCall(`/criteria/${criteriaId}`, {
-                    method: 'DELETE'
-                });
-                
-                alert(`Criteria "${criteriaName}" deleted successfully!\\nDeleted ${result.deleted_votes} related votes.`);
-                
-                // Refresh data
-                await loadInitialData();
-                loadCriteriaList();
-                
-            } catch (error) {
-                console.error('Error deleting criteria:', error);
-                alert('Failed to delete criteria: ' + error.message);
-            }
-        }
-        
-        // Manual refresh
-        async function manualRefresh() {
-            try {
-                console.log('Manual refresh triggered');
-                
-                // Show loading state
-                const refreshBtn = event.target;
-                const originalText = refreshBtn.innerHTML;
-                refreshBtn.innerHTML = '<i class="fas fa-spinner fa-spin"></i> Refreshing...';
-                refreshBtn.disabled = true;
-                
-                // Force reload all data
-                await loadInitialData();
-                
-                // Show success message
-                alert('Data refreshed successfully!');
-                
-                // Restore button
-                refreshBtn.innerHTML = originalText;
-                refreshBtn.disabled = false;
-                
-            } catch (error) {
-                console.error('Error during manual refresh:', error);
-                alert(`Refresh failed: ${error.message}`);
-                
-                // Restore button even on error
-                const refreshBtn = event.target;
-                refreshBtn.innerHTML = '<i class="fas fa-sync"></i> Refresh All Data';
-                refreshBtn.disabled = false;
-            }
-        }
-        
-        // Clear all data
-        async function clearAllSampleData() {
-            if (!confirm('Are you sure you want to delete ALL teams, judges, and votes? This will completely reset the system.')) {
-                return;
-            }
-            
-            if (!confirm('This is your final warning. ALL DATA will be permanently deleted. Continue?')) {
-                return;
-            }
-            
-            try {
-                const result = await apiCall('/clear-sample-data', {
-                    method: 'POST'
-                });
-                
-                console.log('All data cleared:', result);
-                alert(`Success! Deleted ${result.deleted_teams} teams, ${result.deleted_judges} judges, and ${result.deleted_votes} votes.`);
-                
-                // Force refresh currentData from server
-                console.log('Forcing refresh of currentData...');
-                currentData = { teams: [], judges: [], criteria: currentData.criteria || [] };
-                
-                // Force reload all data from server
-                await loadInitialData();
-                
-                // Force refresh all visible tabs
-                const activeTab = document.querySelector('.tab-pane.active, .tab-pane.show');
-                if (activeTab) {
-                    const tabId = activeTab.id;
-                    console.log(`Refreshing active tab: ${tabId}`);
-                    if (tabId === 'teams') {
-                        loadTeams();
-                    } else if (tabId === 'judges') {
-                        loadJudges();
-                    } else if (tabId === 'leaderboard') {
-                        loadLeaderboard();
-                    }
-                }
-                
-                console.log('Clear operation completed successfully');
-                
-            } catch (error) {
-                console.error('Error clearing all data:', error);
-                alert(`Failed to clear data: ${error.message}`);
-            }
-        }
-        
-        // Show error message
-        function showError(message) {
-            const alertHtml = `
-                <div class="alert alert-danger alert-dismissible fade show" role="alert">
-                    <i class="fas fa-exclamation-triangle me-2"></i>
-                    <strong>Error:</strong> ${message}
-                    <button type="button" class="btn-close" data-bs-dismiss="alert"></button>
-                </div>
-            `;
-            
-            // Insert at the top of the container
-            const container = document.querySelector('.container');
-            container.insertAdjacentHTML('afterbegin', alertHtml);
-        }
-        
-        // Tab change handlers
-        document.addEventListener('shown.bs.tab', function (event) {
-            const targetId = event.target.getAttribute('data-bs-target').substring(1);
-            
-            switch (targetId) {
-                case 'teams':
-                    loadTeams();
-                    break;
-                case 'judges':
-                    loadJudges();
-                    break;
-                case 'leaderboard':
-                    loadLeaderboard();
-                    break;
-                case 'admin':
-                    updateSystemStatus();
-                    loadCriteriaList();
-                    break;
-            }
-        });
-        
-        // Initialize on page load
-        document.addEventListener('DOMContentLoaded', function() {
-            console.log('Page loaded, initializing...');
-            loadInitialData();
-        });
-        
-    </script>
-</body>
-</html>'''
+    content_type = STATIC_FILES[filename]
+    etag = f'"{static_file_etag(filename)}"'
+    headers = {
+        **SECURITY_HEADERS,
+        'Content-Type': content_type,
+        'Cache-Control': 'public, max-age=31536000, immutable',
+        'ETag': etag
     }
+    # PNGs are already compressed; only the text files benefit from gzip
+    compressible = not content_type.startswith('image/')
+    gzipped = compressible and accepts_gzip(event)
+    if compressible:
+        headers['Vary'] = 'Accept-Encoding'
+    if gzipped:
+        headers['ETag'] = gzip_etag(etag)
+    if request_header(event, 'If-None-Match') == headers['ETag']:
+        return {'statusCode': 304, 'headers': headers, 'body': ''}
+    if gzipped:
+        headers['Content-Encoding'] = 'gzip'
+        body = get_gzip_base64_file(filename)
+    return {'statusCode': 200, 'headers': headers, 'isBase64Encoded': True, 'body': body}
+
+def build_main_page_html():
+    """Build the complete voting application from main_page.html with the static file URLs filled in"""
+    with open(MAIN_PAGE_TEMPLATE, encoding='utf-8') as template_file:
+        template = template_file.read()
+    # Plain replacement rather than str.format, since the page is full of CSS and JS braces
+    return (template
+            .replace('{class2025_sticker_url}', static_file_url('Class2025IgniteSticker.png'))
+            .replace('{ignite_sticker_url}', static_file_url('IgniteSticker.png'))
+            .replace('{admin_partial_url}', static_file_url('partials/admin.html'))
+            .replace('{app_script_url}', static_file_url('js/app.js'))
+            .replace('{admin_module_url}', static_file_url('js/admin.js'))
+            .replace('{leaderboard_module_url}', static_file_url('js/leaderboard.js')))
+
+# The page is static per deployment, so build it and its gzip encoding once per container
+MAIN_PAGE_HTML = build_main_page_html()
+MAIN_PAGE_GZIP_BODY = base64.b64encode(gzip.compress(MAIN_PAGE_HTML.encode('utf-8'), compresslevel=9)).decode('ascii')
+
+# Browsers revalidate the page on every load; each encoding gets its own ETag since the bytes differ
+MAIN_PAGE_ETAG = body_etag(MAIN_PAGE_HTML)
+MAIN_PAGE_HEADERS = {**HTML_HEADERS, 'Cache-Control': 'no-cache', 'Vary': 'Accept-Encoding', 'ETag': MAIN_PAGE_ETAG}
+MAIN_PAGE_GZIP_HEADERS = {**MAIN_PAGE_HEADERS, 'Content-Encoding': 'gzip', 'ETag': gzip_etag(MAIN_PAGE_ETAG)}
@@ -0,0 +1,375 @@
+// Admin tab: team, judge and criteria management plus the system tools.
+// Imported by the main page script the first time the Admin tab is shown, so judges who only
+// vote never download or compile it. Runs alongside that script and uses its globals
+// (apiCall, apiCache, TAB_DATA_MAX_AGE, loadInitialData, updateCurrentData, cloneTemplate,
+// scheduleWrite, alertBox, showModal, showToast, currentData, DEBUG).
+
+// Admin form fields and buttons, looked up once when the partial is inserted
+let els = null;
+
+// Count badges of the rendered system status by table name; later updates only change their text
+let statusCounts = null;
+
+// Update system status
+export async function updateSystemStatus() {
+    if (!els) {
+        // Admin tab not loaded yet; it refreshes the status when first opened
+        return;
+    }
+
+    try {
+        const debugData = await apiCall('/debug-db?counts_only=1', { maxAge: TAB_DATA_MAX_AGE });
+        const counts = debugData.counts;
+
+        if (!statusCounts) {
+            const status = cloneTemplate('tpl-system-status');
+            statusCounts = {};
+            for (const name of ['teams', 'judges', 'votes', 'criteria']) {
+                statusCounts[name] = status.querySelector(`.count-${name}`);
+            }
+            scheduleWrite(els.systemStatus, status);
+        }
+        // Unchanged counts are left alone so the badges only repaint when a table actually changed
+        for (const name in statusCounts) {
+            const text = String(counts[name]);
+            if (statusCounts[name].textContent !== text) {
+                statusCounts[name].textContent = text;
+            }
+        }
+
+    } catch (error) {
+        console.error('Error loading system status:', error);
+        statusCounts = null;
+        scheduleWrite(els.systemStatus, alertBox('Status unavailable', 'danger', true));
+    }
+}
+
+// Swap a button to a disabled spinner while fn runs, restoring it however fn ends
+async function withBusy(button, label, fn) {
+    const originalHtml = button.innerHTML;
+    button.innerHTML = `<i class="fas fa-spinner fa-spin me-1"></i>${label}`;
+    button.disabled = true;
+    try {
+        return await fn();
+    } finally {
+        button.innerHTML = originalHtml;
+        button.disabled = false;
+    }
+}
+
+// Add team
+async function handleAddTeam(event) {
+    event.preventDefault();
+
+    const name = els.teamName.value.trim();
+    const problemStatement = els.teamProblemStatement.value.trim();
+    const successCriteria = els.teamSuccessCriteria.value.trim();
+
+    if (!name) {
+        showToast('Team name is required.', 'warning');
+        return;
+    }
+
+    try {
+        await withBusy(els.teamSubmit, 'Adding...', async () => {
+            const { message, ...team } = await apiCall('/teams', {
+                method: 'POST',
+                body: JSON.stringify({ 
+                    name, 
+                    problem_statement: problemStatement,
+                    success_criteria: successCriteria 
+                })
+            });
+
+            showToast('Team added successfully!');
+            event.target.reset();
+
+            // The response is the stored team, so the local data is updated without a refetch
+            updateCurrentData({ teams: [...currentData.teams, team] });
+            updateSystemStatus();
+        });
+    } catch (error) {
+        console.error('Error adding team:', error);
+        showToast('Failed to add team: ' + error.message, 'danger');
+    }
+}
+
+// Add judge
+async function handleAddJudge(event) {
+    event.preventDefault();
+
+    const name = els.judgeName.value.trim();
+    const email = els.judgeEmail.value.trim();
+    const role = els.judgeRole.value.trim();
+
+    if (!name || !email) {
+        showToast('Name and email are required.', 'warning');
+        return;
+    }
+
+    try {
+        await withBusy(els.judgeSubmit, 'Adding...', async () => {
+            const { message, ...judge } = await apiCall('/judges', {
+                method: 'POST',
+                body: JSON.stringify({ name, email, role })
+            });
+
+            showToast('Judge added successfully!');
+            event.target.reset();
+
+            updateCurrentData({ judges: [...currentData.judges, judge] });
+            updateSystemStatus();
+        });
+    } catch (error) {
+        console.error('Error adding judge:', error);
+        showToast('Failed to add judge: ' + error.message, 'danger');
+    }
+}
+
+// Add criteria
+async function handleAddCriteria(event) {
+    event.preventDefault();
+
+    const name = els.criteriaName.value.trim();
+    const weight = els.criteriaWeight.value;
+    const description = els.criteriaDescription.value.trim();
+
+    if (!name || !weight) {
+        showToast('Criteria name and weight are required.', 'warning');
+        return;
+    }
+
+    try {
+        await withBusy(els.criteriaSubmit, 'Adding...', async () => {
+            const { message, ...criteria } = await apiCall('/criteria', {
+                method: 'POST',
+                body: JSON.stringify({ name, weight: parseInt(weight), description })
+            });
+
+            showToast('Criteria added successfully!');
+            event.target.reset();
+
+            updateCurrentData({ criteria: [...currentData.criteria, criteria] });
+            updateSystemStatus();
+            loadCriteriaList();
+        });
+    } catch (error) {
+        console.error('Error adding criteria:', error);
+        showToast('Failed to add criteria: ' + error.message, 'danger');
+    }
+}
+
+// Admin tab markup is fetched on first open; the browser caches it by its versioned URL
+let adminPartialPromise = null;
+
+function loadAdminPartial() {
+    if (!adminPartialPromise) {
+        const pane = document.getElementById('admin');
+        adminPartialPromise = fetch(pane.dataset.partialUrl)
+            .then(response => {
+                if (!response.ok) {
+                    throw new Error(`HTTP error! status: ${response.status}`);
+                }
+                return response.text();
+            })
+            .then(html => {
+                pane.innerHTML = html;
+                const byId = id => document.getElementById(id);
+                els = {
+                    systemStatus: byId('system-status'),
+                    criteriaList: byId('criteria-list'),
+                    teamName: byId('team-name'),
+                    teamProblemStatement: byId('team-problem-statement'),
+                    teamSuccessCriteria: byId('team-success-criteria'),
+                    teamSubmit: byId('add-team-form').querySelector('button[type="submit"]'),
+                    judgeName: byId('judge-name'),
+                    judgeEmail: byId('judge-email'),
+                    judgeRole: byId('judge-role'),
+                    judgeSubmit: byId('add-judge-form').querySelector('button[type="submit"]'),
+                    criteriaName: byId('criteria-name'),
+                    criteriaWeight: byId('criteria-weight'),
+                    criteriaDescription: byId('criteria-description'),
+                    criteriaSubmit: byId('add-criteria-form').querySelector('button[type="submit"]')
+                };
+                pane.addEventListener('submit', handleAdminSubmit);
+                pane.addEventListener('click', handleAdminAction);
+            });
+        // Allow a retry on the next tab switch if the fetch failed
+        adminPartialPromise.catch(() => {
+            adminPartialPromise = null;
+        });
+    }
+    return adminPartialPromise;
+}
+
+// Forms in the admin partial name their handler in data-submit; one submit listener on the pane dispatches them
+const SUBMIT_HANDLERS = { 'add-team': handleAddTeam, 'add-judge': handleAddJudge, 'add-criteria': handleAddCriteria };
+
+function handleAdminSubmit(event) {
+    const handler = SUBMIT_HANDLERS[event.target.dataset.submit];
+    if (handler) {
+        handler(event);
+    }
+}
+
+// Buttons in the admin partial name their action in data-action; one listener on the pane handles them all
+function handleAdminAction(event) {
+    const button = event.target.closest('[data-action]');
+    if (!button) {
+        return;
+    }
+
+    switch (button.dataset.action) {
+        case 'refresh-all':
+            manualRefresh(button);
+            break;
+        case 'clear-all':
+            clearAllSampleData();
+            break;
+        case 'refresh-criteria':
+            loadCriteriaList();
+            break;
+        case 'delete-criteria':
+            deleteCriteria(button.dataset.criteriaId, button.dataset.criteriaName);
+            break;
+    }
+}
+
+// Called each time the Admin tab is shown
+export async function init() {
+    await loadAdminPartial();
+    await Promise.all([updateSystemStatus(), loadCriteriaList()]);
+}
+
+// Load criteria list for management
+async function loadCriteriaList() {
+    if (!els) {
+        return;
+    }
+
+    try {
+        const criteria = await apiCall('/criteria', { maxAge: TAB_DATA_MAX_AGE });
+
+        if (criteria.length === 0) {
+            scheduleWrite(els.criteriaList, alertBox('No criteria found.', 'info', true));
+            return;
+        }
+
+        // Weights arrive as JSON numbers, so they sum without parsing
+        const totalWeight = criteria.reduce((sum, c) => sum + c.weight, 0);
+
+        const summary = document.createElement('div');
+        summary.className = 'small mb-2';
+        const total = document.createElement('strong');
+        total.textContent = `Total Weight: ${totalWeight}%`;
+        const check = document.createElement('span');
+        check.className = totalWeight !== 100 ? 'text-warning' : 'text-success';
+        check.textContent = totalWeight !== 100 ? ' (Should be 100%)' : ' ✓';
+        summary.append(total, check);
+        const rows = criteria.map(criteria => {
+            const card = cloneTemplate('tpl-criteria-list-row');
+            card.querySelector('.criteria-name').textContent = criteria.name;
+            card.querySelector('.criteria-description').textContent = criteria.description || 'No description';
+            card.querySelector('.criteria-weight').textContent = `${criteria.weight}%`;
+            Object.assign(card.querySelector('.criteria-delete').dataset, { criteriaId: criteria.id, criteriaName: criteria.name });
+            return card;
+        });
+        scheduleWrite(els.criteriaList, summary, ...rows);
+
+    } catch (error) {
+        console.error('Error loading criteria list:', error);
+        scheduleWrite(els.criteriaList, alertBox('Failed to load criteria: ' + error.message, 'danger', true));
+    }
+}
+
+// Delete criteria
+async function deleteCriteria(criteriaId, criteriaName) {
+    const confirmed = await showModal({
+        title: 'Delete criteria',
+        body: `Are you sure you want to delete "${criteriaName}"?\n\nThis will also delete all votes for this criteria.`,
+        confirm: true,
+        okText: 'Delete'
+    });
+    if (!confirmed) {
+        return;
+    }
+
+    try {
+        const result = await apiCall(`/criteria/${criteriaId}`, {
+            method: 'DELETE'
+        });
+
+        showToast(`Criteria "${criteriaName}" deleted successfully!\nDeleted ${result.deleted_votes} related votes.`);
+
+        updateCurrentData({ criteria: currentData.criteria.filter(criteria => criteria.id !== criteriaId) });
+        updateSystemStatus();
+        loadCriteriaList();
+
+    } catch (error) {
+        console.error('Error deleting criteria:', error);
+        showToast('Failed to delete criteria: ' + error.message, 'danger');
+    }
+}
+
+// Manual refresh
+async function manualRefresh(refreshBtn) {
+    try {
+        if (DEBUG) console.log('Manual refresh triggered');
+
+        await withBusy(refreshBtn, 'Refreshing...', async () => {
+            // Force reload all data, bypassing the tab-switch cache. The criteria list and system status are
+            // independent of /bootstrap, so they reload alongside it; the status refresh loadInitialData
+            // schedules afterwards is then answered from the fresh cache
+            apiCache.clear();
+            await Promise.all([loadInitialData(), loadCriteriaList(), updateSystemStatus()]);
+        });
+
+        showToast('Data refreshed successfully!');
+
+    } catch (error) {
+        console.error('Error during manual refresh:', error);
+        showToast(`Refresh failed: ${error.message}`, 'danger');
+    }
+}
+
+// Clear all data
+async function clearAllSampleData() {
+    const confirmed = await showModal({
+        title: 'Clear all data',
+        body: 'Are you sure you want to delete ALL teams, judges, and votes? This will completely reset the system.',
+        confirm: true,
+        okText: 'Continue'
+    });
+    if (!confirmed) {
+        return;
+    }
+
+    const confirmedAgain = await showModal({
+        title: '⚠️ Final warning',
+        body: 'ALL DATA will be permanently deleted. Continue?',
+        confirm: true,
+        okText: 'Delete everything'
+    });
+    if (!confirmedAgain) {
+        return;
+    }
+
+    try {
+        const result = await apiCall('/clear-sample-data', {
+            method: 'POST'
+        });
+
+        if (DEBUG) console.log('All data cleared:', result);
+        showToast(`Success! Deleted ${result.deleted_teams} teams, ${result.deleted_judges} judges, and ${result.deleted_votes} votes.`);
+
+        // Criteria survive the clear; everything else is now empty
+        updateCurrentData({ teams: [], judges: [] });
+        updateSystemStatus();
+
+        if (DEBUG) console.log('Clear operation completed successfully');
+
+    } catch (error) {
+        console.error('Error clearing all data:', error);
+        showToast(`Failed to clear data: ${error.message}`, 'danger');
+    }
+}
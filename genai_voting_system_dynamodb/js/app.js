@@ -0,0 +1,638 @@
+// Voting page script, loaded by main_page.html after Bootstrap. Its top-level declarations are
+// globals shared with the admin and leaderboard modules.
+
+// Diagnostic console logging; off in production, flip to true while debugging
+const DEBUG = false;
+
+// Static page elements, looked up once; the script is deferred, so the document is parsed when it runs
+const EL = Object.freeze({
+    votingInterface: document.getElementById('voting-interface'),
+    teamsContent: document.getElementById('teams-content'),
+    judgesContent: document.getElementById('judges-content'),
+    leaderboardContent: document.getElementById('leaderboard-content'),
+    errorContainer: document.querySelector('.container'),
+    toastContainer: document.getElementById('toast-container'),
+    resultModal: document.getElementById('result-modal'),
+    resultModalTitle: document.getElementById('result-modal-title'),
+    resultModalBody: document.getElementById('result-modal-body'),
+    resultModalOk: document.getElementById('result-modal-ok'),
+    resultModalCancel: document.getElementById('result-modal-cancel')
+});
+
+// Controls of the rendered voting form, taken from its clone on each render; null until there is a form
+let votingEls = null;
+
+// Global variables
+let currentData = { teams: [], judges: [], criteria: [] };
+
+// Tab pane currently shown, tracked from shown.bs.tab instead of querying the DOM
+let activeTabId = 'voting';
+
+// Teams by id for the team-select details pane
+let teamsById = new Map();
+
+// Data the voting form was last rendered from, so unchanged reloads skip the re-render
+let votingInterfaceKey = null;
+
+// Admin and leaderboard code lives in separate modules, imported the first time their tab is shown;
+// their versioned URLs (ADMIN_MODULE_URL, LEADERBOARD_MODULE_URL) are set by the page
+let adminModule = null;
+
+// In-flight request of each list loader; starting a loader again abandons its previous request,
+// so a slow older response can never overwrite a newer render
+const loaderControllers = new Map();
+
+function restartLoader(name) {
+    loaderControllers.get(name)?.abort();
+    const controller = new AbortController();
+    loaderControllers.set(name, controller);
+    return controller.signal;
+}
+
+// Tab switches settle for this long before loading, so clicking quickly through tabs only loads the last one
+const TAB_LOAD_DELAY = 50;
+let tabLoadTimer = null;
+
+// Last GET response per URL with its ETag; repeat GETs revalidate and unchanged data comes back as a bodyless 304
+const apiCache = new Map();
+
+// How long tab loaders reuse a cached response without asking the server, so flipping between tabs is instant
+const TAB_DATA_MAX_AGE = 5000;
+
+// Browsers cap the total body size of keepalive requests at 64 KB
+const KEEPALIVE_MAX_BODY = 60000;
+
+// GETs currently on the wire per URL; callers asking for the same URL meanwhile share the one request
+const inflightGets = new Map();
+
+// API helper function with correct path; GETs passing maxAge (ms) are answered from the cache while it is that fresh
+async function apiCall(endpoint, options = {}) {
+    const { maxAge = 0, ...fetchOptions } = options;
+    const url = endpoint.startsWith('/') ? `/Prod/api${endpoint}` : `/Prod/api/${endpoint}`;
+    const isGet = (fetchOptions.method || 'GET').toUpperCase() === 'GET';
+    if (!isGet) {
+        return sendRequest(url, false, fetchOptions);
+    }
+    
+    const cached = apiCache.get(url);
+    if (cached && Date.now() - cached.fetchedAt < maxAge) {
+        return cached.data;
+    }
+    
+    // The shared request ignores any one caller's signal; an aborted caller just stops waiting for it
+    const { signal, ...sharedOptions } = fetchOptions;
+    let request = inflightGets.get(url);
+    if (!request) {
+        request = sendRequest(url, true, sharedOptions).finally(() => inflightGets.delete(url));
+        inflightGets.set(url, request);
+    }
+    return signal ? untilAborted(request, signal) : request;
+}
+
+// Settle with the request, or reject with an AbortError as soon as the signal fires
+function untilAborted(request, signal) {
+    return new Promise((resolve, reject) => {
+        const onAbort = () => reject(new DOMException('The request was abandoned', 'AbortError'));
+        if (signal.aborted) {
+            onAbort();
+            return;
+        }
+        signal.addEventListener('abort', onAbort, { once: true });
+        request.then(resolve, reject).finally(() => signal.removeEventListener('abort', onAbort));
+    });
+}
+
+// Send one request and parse its JSON body; GETs revalidate against and refill apiCache
+async function sendRequest(url, isGet, fetchOptions) {
+    const cached = isGet ? apiCache.get(url) : undefined;
+    const { body } = fetchOptions;
+    const response = await fetch(url, {
+        // Small writes survive the page being closed mid-request, so a vote submitted just before leaving still lands
+        keepalive: typeof body === 'string' && body.length < KEEPALIVE_MAX_BODY,
+        ...fetchOptions,
+        headers: {
+            // Only bodies need a type; bodyless GETs stay simple requests
+            ...(body && { 'Content-Type': 'application/json' }),
+            ...(cached && { 'If-None-Match': cached.etag }),
+            ...fetchOptions.headers
+        }
+    });
+    
+    if (!isGet) {
+        // A write can change other resources too (votes move the leaderboard), so drop every entry
+        apiCache.clear();
+    } else if (response.status === 304 && cached) {
+        cached.fetchedAt = Date.now();
+        return cached.data;
+    }
+    
+    // Nothing to parse for bodiless responses
+    if (response.status === 204 || response.headers.get('Content-Length') === '0') {
+        if (!response.ok) {
+            throw new Error(`HTTP error! status: ${response.status}`);
+        }
+        return null;
+    }
+    
+    const responseData = await response.json();
+    
+    if (!response.ok) {
+        // For 409 (Conflict) status, include the response data in the error
+        if (response.status === 409) {
+            const error = new Error('duplicate_votes');
+            error.code = 'DUPLICATE_VOTES';
+            error.response = responseData;
+            throw error;
+        } else {
+            throw new Error(responseData.error || `HTTP error! status: ${response.status}`);
+        }
+    }
+    
+    const etag = response.headers.get('ETag');
+    if (isGet && etag) {
+        apiCache.set(url, { etag, data: responseData, fetchedAt: Date.now() });
+    }
+    
+    return responseData;
+}
+
+// Clone the root element of a <template> so it can be filled in before insertion
+function cloneTemplate(templateId) {
+    return document.getElementById(templateId).content.firstElementChild.cloneNode(true);
+}
+
+// Show an optional card section with its text, or drop it when the value is empty
+function fillOptionalSection(section, text) {
+    if (text) {
+        section.querySelector('p').textContent = text;
+    } else {
+        section.remove();
+    }
+}
+
+// List renders queue their containers' new child nodes for the next animation frame, so renders that
+// finish together cost one layout pass; a later write to the same container replaces an earlier one
+let pendingWrites = null;
+
+function scheduleWrite(container, ...nodes) {
+    if (!pendingWrites) {
+        pendingWrites = new Map();
+        requestAnimationFrame(() => {
+            const writes = pendingWrites;
+            pendingWrites = null;
+            writes.forEach((nodes, container) => container.replaceChildren(...nodes));
+        });
+    }
+    pendingWrites.set(container, nodes);
+}
+
+// Run secondary work once the browser is idle (setTimeout where requestIdleCallback is missing)
+const whenIdle = window.requestIdleCallback
+    ? callback => requestIdleCallback(callback, { timeout: 500 })
+    : callback => setTimeout(callback, 1);
+
+// Load initial data
+async function loadInitialData() {
+    try {
+        if (DEBUG) console.log('Loading initial data...');
+        const { teams, judges, criteria } = await apiCall('/bootstrap');
+        
+        if (DEBUG) console.log('Initial data loaded:', { teams: teams.length, judges: judges.length, criteria: criteria.length });
+        currentData = { teams, judges, criteria };
+        teamsById = new Map(teams.map(team => [team.id, team]));
+        
+        // The voting form is the primary flow, so it renders first
+        loadVotingInterface();
+        
+        whenIdle(() => {
+            if (adminModule) {
+                adminModule.updateSystemStatus();
+            }
+            
+            // Refresh the visible tab
+            if (activeTabId === 'teams') {
+                renderTeams();
+            } else if (activeTabId === 'judges') {
+                renderJudges();
+            } else if (activeTabId === 'leaderboard') {
+                loadLeaderboard();
+            }
+        });
+        
+    } catch (error) {
+        console.error('Error loading initial data:', error);
+        showError('Failed to load initial data: ' + error.message);
+    }
+}
+
+// Filled-in criteria rows by id, cloned on each voting render and rebuilt only when the criterion changes
+const criteriaRowCache = new Map();
+
+function buildCriteriaRow(criteria) {
+    const row = cloneTemplate('tpl-criteria-row');
+    row.querySelector('.criteria-name').textContent = criteria.name;
+    row.querySelector('.criteria-weight').textContent = `Weight: ${criteria.weight}%`;
+    const yes = row.querySelector('.criteria-yes');
+    const no = row.querySelector('.criteria-no');
+    yes.name = no.name = `criteria_${criteria.id}`;
+    yes.id = row.querySelector('.criteria-yes-label').htmlFor = `yes_${criteria.id}`;
+    no.id = row.querySelector('.criteria-no-label').htmlFor = `no_${criteria.id}`;
+    const comments = row.querySelector('textarea');
+    comments.id = comments.name = `comments_${criteria.id}`;
+    return row;
+}
+
+// Fold a successful write into currentData and re-render the voting form from it, instead of
+// refetching everything through loadInitialData
+function updateCurrentData(changes) {
+    currentData = { ...currentData, ...changes };
+    teamsById = new Map(currentData.teams.map(team => [team.id, team]));
+    loadVotingInterface();
+}
+
+// Load voting interface
+function loadVotingInterface() {
+    const container = EL.votingInterface;
+    
+    // Only what the form displays goes into the key; team details are read live on change
+    const renderKey = JSON.stringify([
+        currentData.judges.map(judge => [judge.id, judge.name, judge.email]),
+        currentData.teams.map(team => [team.id, team.name]),
+        currentData.criteria.map(criteria => [criteria.id, criteria.name, criteria.weight])
+    ]);
+    if (renderKey === votingInterfaceKey) {
+        return;
+    }
+    votingInterfaceKey = renderKey;
+    
+    if (currentData.judges.length === 0 || currentData.teams.length === 0) {
+        votingEls = null;
+        container.innerHTML = `
+            <div class="alert alert-warning">
+                <i class="fas fa-exclamation-triangle me-2"></i>
+                <strong>Setup Required:</strong> Please add teams and judges in the Admin tab before voting can begin.
+            </div>
+        `;
+        return;
+    }
+    
+    // Fill a detached clone of the form, then swap it in with a single DOM insertion
+    const form = cloneTemplate('tpl-voting-form');
+    const judgeSelect = form.querySelector('#judge-select');
+    currentData.judges.forEach(judge => judgeSelect.add(new Option(`${judge.name} (${judge.email})`, judge.id)));
+    const teamSelect = form.querySelector('#team-select');
+    currentData.teams.forEach(team => teamSelect.add(new Option(team.name, team.id)));
+    
+    const criteriaRows = document.createDocumentFragment();
+    currentData.criteria.forEach(criteria => {
+        let cached = criteriaRowCache.get(criteria.id);
+        if (!cached || cached.name !== criteria.name || cached.weight !== criteria.weight) {
+            cached = { name: criteria.name, weight: criteria.weight, row: buildCriteriaRow(criteria) };
+            criteriaRowCache.set(criteria.id, cached);
+        }
+        criteriaRows.appendChild(cached.row.cloneNode(true));
+    });
+    // Forget rows for criteria that have been deleted
+    const criteriaIds = new Set(currentData.criteria.map(criteria => criteria.id));
+    criteriaRowCache.forEach((cached, id) => {
+        if (!criteriaIds.has(id)) {
+            criteriaRowCache.delete(id);
+        }
+    });
+    form.querySelector('#criteria-voting').appendChild(criteriaRows);
+    votingEls = {
+        judgeSelect,
+        teamSelect,
+        teamDetails: form.querySelector('#team-details'),
+        teamDetailsContent: form.querySelector('#team-details-content')
+    };
+    container.replaceChildren(form);
+}
+
+// Show the selected team's details under the voting form, or hide them when no team is selected
+function showTeamDetails(teamId) {
+    const { teamDetails: teamDetailsDiv, teamDetailsContent } = votingEls;
+    
+    if (teamId) {
+        const selectedTeam = teamsById.get(teamId);
+        if (selectedTeam) {
+            const details = cloneTemplate('tpl-team-details');
+            details.querySelector('.team-name').textContent = selectedTeam.name;
+            fillOptionalSection(details.querySelector('.team-problem-statement'), selectedTeam.problem_statement);
+            fillOptionalSection(details.querySelector('.team-success-criteria'), selectedTeam.success_criteria);
+            teamDetailsContent.replaceChildren(details);
+            teamDetailsDiv.style.display = 'block';
+        }
+    } else {
+        teamDetailsDiv.style.display = 'none';
+    }
+}
+
+// The voting form is re-rendered from its template, so its handlers listen once on the container
+// instead of being bound again to every new form
+EL.votingInterface.addEventListener('change', function(event) {
+    if (event.target === votingEls?.teamSelect) {
+        showTeamDetails(event.target.value);
+    }
+});
+EL.votingInterface.addEventListener('submit', handleVoteSubmission);
+
+// Auto-expand fallback for browsers without CSS field-sizing: one listener on the container
+// that survives re-renders, with resizes batched into the next animation frame
+const textareasToExpand = new Set();
+
+function expandPendingTextareas() {
+    textareasToExpand.forEach(textarea => {
+        textarea.style.height = 'auto';
+        textarea.style.height = Math.max(31, textarea.scrollHeight) + 'px';
+    });
+    textareasToExpand.clear();
+}
+
+if (!CSS.supports('field-sizing', 'content')) {
+    EL.votingInterface.addEventListener('input', function(event) {
+        if (!event.target.matches('.auto-expand-textarea')) {
+            return;
+        }
+        if (textareasToExpand.size === 0) {
+            requestAnimationFrame(expandPendingTextareas);
+        }
+        textareasToExpand.add(event.target);
+    }, { passive: true });
+}
+
+// Dialogs are queued so a result never opens over a confirmation that is still closing
+let modalQueue = Promise.resolve();
+
+// Non-blocking replacement for alert()/confirm(); resolves true when OK was clicked
+function showModal({ title, body, confirm = false, okText = 'OK' }) {
+    const result = modalQueue.then(() => new Promise(resolve => {
+        const element = EL.resultModal;
+        const okButton = EL.resultModalOk;
+        const cancelButton = EL.resultModalCancel;
+        EL.resultModalTitle.textContent = title;
+        EL.resultModalBody.textContent = body;
+        okButton.textContent = okText;
+        cancelButton.hidden = !confirm;
+        
+        const modal = bootstrap.Modal.getOrCreateInstance(element);
+        let confirmed = false;
+        okButton.onclick = () => {
+            confirmed = true;
+            modal.hide();
+        };
+        cancelButton.onclick = () => modal.hide();
+        element.addEventListener('hidden.bs.modal', () => resolve(confirmed), { once: true });
+        modal.show();
+    }));
+    modalQueue = result;
+    return result;
+}
+
+// Non-blocking notification for outcomes that need no answer; type is a Bootstrap colour such as 'success' or 'danger'
+function showToast(message, type = 'success') {
+    const toast = cloneTemplate('tpl-toast');
+    toast.classList.add(`bg-${type}`);
+    toast.querySelector('.toast-body').textContent = message;
+    toast.addEventListener('hidden.bs.toast', () => toast.remove());
+    EL.toastContainer.appendChild(toast);
+    bootstrap.Toast.getOrCreateInstance(toast).show();
+}
+
+// Handle vote submission
+async function handleVoteSubmission(event, overwriteExisting = false) {
+    event.preventDefault();
+    
+    const judgeId = votingEls.judgeSelect.value;
+    const teamId = votingEls.teamSelect.value;
+    
+    if (!judgeId || !teamId) {
+        showToast('Please select both a judge and a team.', 'warning');
+        return;
+    }
+    
+    const submitButton = event.target.querySelector('button[type="submit"]');
+    const originalText = submitButton.innerHTML;
+    submitButton.innerHTML = '<i class="fas fa-spinner fa-spin me-2"></i>Submitting...';
+    submitButton.disabled = true;
+    
+    try {
+        // One FormData walk picks up every checked radio and comment by name
+        const formData = new FormData(event.target);
+        const votes = currentData.criteria.flatMap(criteria => {
+            const selectedValue = formData.get(`criteria_${criteria.id}`);
+            if (selectedValue === null) {
+                return [];
+            }
+            return [{
+                criteria_id: criteria.id,
+                score: parseInt(selectedValue),
+                comments: formData.get(`comments_${criteria.id}`) || ''
+            }];
+        });
+        
+        if (votes.length === 0) {
+            showToast('Please vote on at least one criterion.', 'warning');
+            return;
+        }
+        
+        // Use the new batch submission endpoint with email notification
+        const response = await apiCall('/submit-votes', {
+            method: 'POST',
+            body: JSON.stringify({
+                judge_id: judgeId,
+                team_id: teamId,
+                votes: votes,
+                overwrite_existing: overwriteExisting
+            })
+        });
+        
+        // Show success message with email confirmation
+        const emailStatus = response.email_status === 'failed' ? 
+            '\n\n⚠️ Note: Email confirmation could not be sent.' : 
+            `\n\n📧 Confirmation email ${response.email_status === 'queued' ? 'on its way' : 'sent'} to: ${response.judge_email}`;
+        
+        let successMessage = `✅ Successfully submitted ${response.votes_count} votes!`;
+        
+        // Add overwrite information if applicable
+        if (response.action === 'overwrite') {
+            successMessage += `\n\n🔄 Updated previous votes (${response.overwritten_votes} votes replaced)`;
+        }
+        
+        showModal({ title: 'Votes submitted', body: successMessage + emailStatus });
+        
+        // Reset form
+        event.target.reset();
+        
+        // Reset textarea heights set by the auto-expand fallback
+        const commentTextareas = document.querySelectorAll('.auto-expand-textarea');
+        commentTextareas.forEach(textarea => {
+            textarea.style.height = '';
+        });
+        
+        // Hide team details section
+        votingEls.teamDetails.style.display = 'none';
+        
+        // Refresh leaderboard if visible
+        if (activeTabId === 'leaderboard') {
+            loadLeaderboard();
+        }
+        
+    } catch (error) {
+        console.error('Error submitting votes:', error);
+        
+        // Handle duplicate vote error specifically
+        if (error.code === 'DUPLICATE_VOTES') {
+            const errorData = error.response;
+            const existingDate = new Date(errorData.existing_votes_date).toLocaleString();
+            
+            const confirmMessage = `You have already voted for this team on ${existingDate}.\n` +
+                `Existing votes: ${errorData.existing_votes_count}\n\n` +
+                `Do you want to OVERWRITE your previous votes?\n\n` +
+                `⚠️ This action cannot be undone!`;
+            
+            if (await showModal({ title: '⚠️ Duplicate vote detected', body: confirmMessage, confirm: true, okText: 'Overwrite' })) {
+                // Retry with overwrite flag
+                await handleVoteSubmission(event, true);
+                return;
+            } else {
+                showToast('Submission cancelled. Your previous votes remain unchanged.', 'secondary');
+            }
+        } else {
+            showModal({ title: 'Submission failed', body: 'Failed to submit votes: ' + error.message });
+        }
+    } finally {
+        submitButton.innerHTML = originalText;
+        submitButton.disabled = false;
+    }
+}
+
+// Render the Teams tab from the teams /bootstrap already loaded; its Refresh button reloads that data
+function renderTeams() {
+    const container = EL.teamsContent;
+    const teams = currentData.teams;
+    
+    if (teams.length === 0) {
+        scheduleWrite(container, alertBox('No teams found. Add teams in the Admin tab.', 'info'));
+        return;
+    }
+    
+    const row = document.createElement('div');
+    row.className = 'row';
+    teams.forEach(team => {
+        const card = cloneTemplate('tpl-team-card');
+        card.querySelector('.team-name').textContent = team.name;
+        fillOptionalSection(card.querySelector('.team-problem-statement'), team.problem_statement);
+        fillOptionalSection(card.querySelector('.team-success-criteria'), team.success_criteria);
+        row.appendChild(card);
+    });
+    scheduleWrite(container, row);
+}
+
+// Render the Judges tab from the judges /bootstrap already loaded; its Refresh button reloads that data
+function renderJudges() {
+    const container = EL.judgesContent;
+    const judges = currentData.judges;
+    
+    if (judges.length === 0) {
+        scheduleWrite(container, alertBox('No judges found. Add judges in the Admin tab.', 'info'));
+        return;
+    }
+    
+    const row = document.createElement('div');
+    row.className = 'row';
+    judges.forEach(judge => {
+        const card = cloneTemplate('tpl-judge-card');
+        card.querySelector('.judge-name').textContent = judge.name;
+        card.querySelector('.judge-email').textContent = judge.email;
+        card.querySelector('.judge-role').textContent = judge.role || 'Judge';
+        row.appendChild(card);
+    });
+    scheduleWrite(container, row);
+}
+
+// Load leaderboard
+async function loadLeaderboard() {
+    try {
+        const leaderboard = await import(LEADERBOARD_MODULE_URL);
+        await leaderboard.loadLeaderboard();
+    } catch (error) {
+        console.error('Error loading leaderboard module:', error);
+        showError('Failed to load leaderboard: ' + error.message);
+    }
+}
+
+// Open the admin tab, importing its module on first use
+async function openAdminTab() {
+    try {
+        adminModule = adminModule || await import(ADMIN_MODULE_URL);
+        await adminModule.init();
+    } catch (error) {
+        console.error('Error loading admin tools:', error);
+        showError('Failed to load admin tools: ' + error.message);
+    }
+}
+
+// Show error message
+function showError(message) {
+    const alert = cloneTemplate('tpl-error-alert');
+    // Messages can carry server-supplied text, so they go in as text rather than markup
+    alert.querySelector('.error-message').textContent = message;
+    
+    // Insert at the top of the container
+    EL.errorContainer.prepend(alert);
+}
+
+// Icon shown in each kind of alertBox
+const ALERT_ICONS = { danger: 'fa-exclamation-triangle', info: 'fa-info-circle' };
+
+// Alert box for an empty or failed load, with the message set as text; small matches the admin side panels
+function alertBox(message, type = 'danger', small = false) {
+    const alert = document.createElement('div');
+    alert.className = `alert alert-${type}` + (small ? ' small' : '');
+    const icon = document.createElement('i');
+    icon.className = `fas ${ALERT_ICONS[type]} ` + (small ? 'me-1' : 'me-2');
+    alert.append(icon, message);
+    return alert;
+}
+
+// Tab change handlers
+document.addEventListener('shown.bs.tab', function (event) {
+    const targetId = event.target.getAttribute('data-bs-target').substring(1);
+    activeTabId = targetId;
+    
+    clearTimeout(tabLoadTimer);
+    tabLoadTimer = setTimeout(() => {
+        switch (targetId) {
+            case 'teams':
+                renderTeams();
+                break;
+            case 'judges':
+                renderJudges();
+                break;
+            case 'leaderboard':
+                loadLeaderboard();
+                break;
+            case 'admin':
+                openAdminTab();
+                break;
+        }
+    }, TAB_LOAD_DELAY);
+});
+
+// Refresh buttons on the Teams, Judges and Leaderboard tabs name their loader in data-refresh;
+// one delegated listener serves them all. Teams and judges come from /bootstrap, so they reload it
+const REFRESH_LOADERS = { teams: loadInitialData, judges: loadInitialData, leaderboard: loadLeaderboard };
+
+document.addEventListener('click', function (event) {
+    const button = event.target.closest('[data-refresh]');
+    if (button) {
+        REFRESH_LOADERS[button.dataset.refresh]();
+    }
+});
+
+// Initialize on page load
+document.addEventListener('DOMContentLoaded', function() {
+    if (DEBUG) console.log('Page loaded, initializing...');
+    loadInitialData();
+});
@@ -0,0 +1,52 @@
+// Leaderboard tab, imported by the main page script the first time the leaderboard is shown.
+// Runs alongside that script and uses its globals (apiCall, restartLoader, TAB_DATA_MAX_AGE,
+// cloneTemplate, scheduleWrite, alertBox, EL).
+
+// Rank badge colour classes for the top three leaderboard places, then for every place after them
+const RANK_BADGE_CLASSES = [['bg-warning', 'text-dark'], ['bg-secondary'], ['bg-info'], ['bg-light', 'text-dark']];
+const LAST_RANK_BADGE = RANK_BADGE_CLASSES.length - 1;
+
+// Load leaderboard
+export async function loadLeaderboard() {
+    const container = EL.leaderboardContent;
+
+    try {
+        const leaderboard = await apiCall('/leaderboard', { maxAge: TAB_DATA_MAX_AGE, signal: restartLoader('leaderboard') });
+
+        if (leaderboard.length === 0) {
+            scheduleWrite(container, alertBox('No votes submitted yet. Start voting to see the leaderboard!', 'info'));
+            return;
+        }
+
+        const row = document.createElement('div');
+        row.className = 'row';
+        leaderboard.forEach((team, index) => {
+            const item = cloneTemplate('tpl-leaderboard-row');
+            const rankBadge = item.querySelector('.rank-badge');
+            rankBadge.classList.add(...RANK_BADGE_CLASSES[Math.min(index, LAST_RANK_BADGE)]);
+            if (index === 0) {
+                item.querySelector('.leaderboard-item').classList.add('border-warning');
+                const crown = document.createElement('i');
+                crown.className = 'fas fa-crown';
+                rankBadge.appendChild(crown);
+            } else {
+                rankBadge.textContent = '#' + (index + 1);
+            }
+            item.querySelector('.team-name').textContent = team.team_name;
+            item.querySelector('.team-problem-statement').textContent = team.problem_statement || 'No problem statement provided';
+            item.querySelector('.total-score').textContent = team.total_score_fmt;
+            item.querySelector('.vote-count').textContent = team.vote_count;
+            item.querySelector('.judge-count').textContent = team.judge_count;
+            item.querySelector('.weighted-percentage').textContent = team.weighted_percentage_fmt;
+            row.appendChild(item);
+        });
+        scheduleWrite(container, row);
+
+    } catch (error) {
+        if (error.name === 'AbortError') {
+            return;
+        }
+        console.error('Error loading leaderboard:', error);
+        scheduleWrite(container, alertBox('Failed to load leaderboard: ' + error.message));
+    }
+}